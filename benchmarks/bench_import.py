@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""Import-time check for the helper modules in scripts/.
+
+Runs `python -X importtime -c "import <module>"` in a fresh interpreter,
+reports the module's cumulative import time, and fails (exit 1) if it exceeds
+the budget or if a heavy dependency got imported eagerly.
+
+Usage: python benchmarks/bench_import.py [--repeat 5] [--budget-ms 400]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+SCRIPTS = Path(__file__).resolve().parent.parent / 'scripts'
+
+# module -> dependencies that must NOT be loaded just by importing it
+LAZY_DEPENDENCIES = {
+    'plotting_utils': ['matplotlib', 'matplotlib.pyplot', 'seaborn', 'pandas', 'sklearn', 'scipy'],
+}
+
+
+def import_profile(module: str):
+    """Return (cumulative microseconds for `module`, set of module names imported)."""
+    code = f"import sys, {module}; print('\\n'.join(sys.modules))"
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [str(SCRIPTS), os.environ.get('PYTHONPATH')])))
+    res = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                         capture_output=True, text=True, env=env, check=True)
+    cumulative = None
+    for line in res.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package"
+        parts = [p.strip() for p in line.split('|')]
+        if len(parts) == 3 and parts[2] == module:
+            cumulative = int(parts[1])
+    return cumulative, set(res.stdout.split())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--budget-ms', type=float, default=400.0,
+                        help='fail if the median cumulative import time exceeds this')
+    args = parser.parse_args()
+
+    failed = False
+    for module, lazy in LAZY_DEPENDENCIES.items():
+        runs = [import_profile(module) for _ in range(args.repeat)]
+        median_ms = statistics.median(us for us, _ in runs) / 1000
+        eager = sorted(m for m in lazy if m in runs[0][1])
+        status = 'ok'
+        if median_ms > args.budget_ms:
+            status = f'FAIL: over {args.budget_ms:.0f} ms budget'
+        if eager:
+            status = f'FAIL: eagerly imports {", ".join(eager)}'
+        failed |= status != 'ok'
+        print(f'{module:<20}{median_ms:>9.1f} ms  {status}')
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Throughput of pptx_to_rtf.rtf_escape / write_rtf against the original per-character code.
+
+Usage: python benchmarks/bench_rtf.py [--mb 20]
+"""
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+from pptx_to_rtf import rtf_escape, write_rtf
+
+
+def rtf_escape_reference(s: str) -> str:
+    out = []
+    for ch in s:
+        code = ord(ch)
+        if ch in ['\\', '{', '}']:
+            out.append('\\' + ch)
+        elif 0x20 <= code <= 0x7E:
+            out.append(ch)
+        else:
+            out.append(f"\\u{code}?")
+    return ''.join(out)
+
+
+def write_rtf_reference(slides, out_path: Path):
+    with open(out_path, 'w', encoding='utf-8') as f:
+        f.write('{\\rtf1\\ansi\\deff0{\\fonttbl{\\f0 Arial;}}\n')
+        f.write('\\fs22 ')
+        for idx, paras in enumerate(slides, start=1):
+            f.write('\\b ' + rtf_escape_reference(f'Slide {idx}') + ' \\b0\\par\n')
+            if not paras:
+                f.write(rtf_escape_reference(' (no visible text)') + '\\par\n')
+                continue
+            for para in paras:
+                line = rtf_escape_reference(' - ' + para)
+                f.write(line + '\\par\n')
+            f.write('\\par\n')
+        f.write('}\n')
+
+
+def synthetic_slides(total_chars: int, non_ascii: float, seed: int = 0):
+    rng = random.Random(seed)
+    ascii_words = ['daylight', 'glare', 'pilot', 'protocol', '{x}', 'a\\b', 'thermal', 'comfort', 'EUI']
+    other_words = ['café', 'naïve', '採光', '—', 'μ-value', '°C']
+    slides, size = [], 0
+    while size < total_chars:
+        paras = []
+        for _ in range(rng.randint(0, 12)):
+            words = [rng.choice(other_words) if rng.random() < non_ascii else rng.choice(ascii_words)
+                     for _ in range(rng.randint(3, 25))]
+            para = ' '.join(words)
+            paras.append(para)
+            size += len(para)
+        slides.append(paras)
+    return slides
+
+
+def mb_per_s(n_chars: int, seconds: float) -> float:
+    return n_chars / 1e6 / seconds if seconds else float('inf')
+
+
+def timed(fn, *args):
+    t0 = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - t0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--mb', type=float, default=20.0, help='approximate corpus size in MB of text')
+    args = parser.parse_args()
+    total = int(args.mb * 1e6)
+
+    print(f"{'corpus':<12}{'stage':<12}{'reference MB/s':>16}{'current MB/s':>14}{'speedup':>9}")
+    for label, non_ascii in [('ascii', 0.0), ('mixed 10%', 0.1)]:
+        slides = synthetic_slides(total, non_ascii)
+        text = '\n'.join(p for paras in slides for p in paras)
+        n = len(text)
+
+        ref, t_ref = timed(rtf_escape_reference, text)
+        cur, t_cur = timed(rtf_escape, text)
+        assert ref == cur, 'rtf_escape output differs from reference'
+        print(f"{label:<12}{'escape':<12}{mb_per_s(n, t_ref):>16.1f}{mb_per_s(n, t_cur):>14.1f}{t_ref / t_cur:>8.1f}x")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            ref_path, cur_path = Path(tmp) / 'ref.rtf', Path(tmp) / 'cur.rtf'
+            _, t_ref = timed(write_rtf_reference, slides, ref_path)
+            _, t_cur = timed(write_rtf, iter(slides), cur_path)
+            assert ref_path.read_bytes() == cur_path.read_bytes(), 'write_rtf output differs from reference'
+        print(f"{label:<12}{'write_rtf':<12}{mb_per_s(n, t_ref):>16.1f}{mb_per_s(n, t_cur):>14.1f}{t_ref / t_cur:>8.1f}x")
+
+
+if __name__ == '__main__':
+    main()
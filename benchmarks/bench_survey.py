@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""Rows per second of data_simulation.simulate_survey_responses, per-row loop vs vectorised.
+
+Usage: python benchmarks/bench_survey.py [--rows 10000 100000 1000000]
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+from data_simulation import simulate_survey_responses
+
+
+def rows_per_second(n: int, **kwargs) -> float:
+    t0 = time.perf_counter()
+    simulate_survey_responses(n, **kwargs)
+    return n / (time.perf_counter() - t0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, nargs='+', default=[10_000, 100_000, 1_000_000])
+    parser.add_argument('--max-loop-rows', type=int, default=200_000,
+                        help='skip the per-row loop above this size (it takes minutes at 1M+)')
+    args = parser.parse_args()
+
+    print(f"{'rows':>10}{'loop rows/s':>16}{'vectorised rows/s':>20}{'speedup':>9}")
+    for n in args.rows:
+        fast = rows_per_second(n, seed_compatible=False)
+        if n <= args.max_loop_rows:
+            slow = rows_per_second(n)
+            print(f"{n:>10}{slow:>16,.0f}{fast:>20,.0f}{fast / slow:>8.1f}x")
+        else:
+            print(f"{n:>10}{'-':>16}{fast:>20,.0f}{'-':>9}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+"""Synthetic inputs for the benchmark suite, generated deterministically at any scale.
+
+Submissions are built from simulate_survey_responses text with rubric terms
+mixed in; decks and PDFs are written to a temporary directory. Nothing here
+touches real student work.
+"""
+import random
+import sys
+import zipfile
+from pathlib import Path
+from typing import List
+from xml.sax.saxutils import escape
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+from data_simulation import simulate_survey_responses
+
+RUBRIC_SPRINKLE = ['research question', 'pilot', 'protocol', 'consent', 'figure', 'sample size',
+                   'interview', 'survey', 'statistical', 'limitations', 'agent-based', 'anylogic']
+UNICODE_SPRINKLE = ['é', '—', '“', '”', '°C', '中文', 'ü']
+
+
+def submission_text(n_words: int, seed: int = 0) -> str:
+    """Roughly n_words of survey-style prose with rubric terms every ~40 words."""
+    rng = random.Random(seed)
+    sentences = simulate_survey_responses(max(1, n_words // 8), random_state=seed, seed_compatible=False)['response_text'].tolist()
+    words: List[str] = []
+    while len(words) < n_words:
+        words.extend(rng.choice(sentences).split())
+        if rng.random() < 0.2:
+            words.append(rng.choice(RUBRIC_SPRINKLE))
+    return ' '.join(words[:n_words])
+
+
+def mixed_text(n_chars: int, unicode_share: float = 0.02, seed: int = 0) -> str:
+    """Mostly-ASCII text with braces, backslashes and some non-ASCII, for RTF escaping."""
+    rng = random.Random(seed)
+    base = submission_text(max(1, n_chars // 6), seed)
+    out, size = [], 0
+    for word in base.split():
+        r = rng.random()
+        if r < unicode_share:
+            word += rng.choice(UNICODE_SPRINKLE)
+        elif r < unicode_share + 0.005:
+            word = '{' + word + '}\\'
+        out.append(word)
+        size += len(word) + 1
+        if size >= n_chars:
+            break
+    return ' '.join(out)[:n_chars]
+
+
+def slides(n_slides: int, paras_per_slide: int = 8, seed: int = 0) -> List[List[str]]:
+    text = mixed_text(n_slides * paras_per_slide * 60, seed=seed).split(' ')
+    rng = random.Random(seed)
+    deck, pos = [], 0
+    for _ in range(n_slides):
+        paras = []
+        for _ in range(paras_per_slide):
+            k = rng.randint(4, 14)
+            paras.append(' '.join(text[pos:pos + k]) or 'empty')
+            pos = (pos + k) % max(1, len(text) - 14)
+        deck.append(paras)
+    return deck
+
+
+def write_pptx(path: Path, n_slides: int, paras_per_slide: int = 8, seed: int = 0) -> Path:
+    """A minimal .pptx zip: one DrawingML slide part per slide (enough for pptx_to_rtf)."""
+    ns = ('xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main" '
+          'xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main"')
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as z:
+        for i, paras in enumerate(slides(n_slides, paras_per_slide, seed), start=1):
+            body = ''.join(f'<a:p><a:r><a:t>{escape(p)}</a:t></a:r></a:p>' for p in paras)
+            z.writestr(f'ppt/slides/slide{i}.xml',
+                       f'<?xml version="1.0" encoding="UTF-8"?><p:sld {ns}><p:cSld><p:spTree><p:sp>'
+                       f'<p:txBody>{body}</p:txBody></p:sp></p:spTree></p:cSld></p:sld>')
+    return path
+
+
+def write_pdf(path: Path, n_pages: int, lines_per_page: int = 30, seed: int = 0) -> Path:
+    """A text PDF with n_pages pages, drawn with matplotlib's PDF backend."""
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    from matplotlib.backends.backend_pdf import PdfPages
+
+    words = submission_text(n_pages * lines_per_page * 10, seed).split()
+    with PdfPages(path) as pdf:
+        for page in range(n_pages):
+            fig = plt.figure(figsize=(8.27, 11.69))
+            for line in range(lines_per_page):
+                start = (page * lines_per_page + line) * 10
+                fig.text(0.05, 0.95 - line * 0.03, ' '.join(words[start:start + 10]), fontsize=9)
+            pdf.savefig(fig)
+            plt.close(fig)
+    return path
@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""Benchmark suite: throughput and peak memory for the scripts/ helpers at several scales.
+
+Every case builds its synthetic input first (see corpora.py; not timed), then
+reports the best of --repeat runs as units/second, plus the peak traced
+allocation of one extra run under tracemalloc.
+
+Absolute timings swing with the host's load, so they are not compared.
+Instead every round of a case is paired with a round of a fixed reference
+workload, and the case is recorded as the median ratio of the two (in the
+spirit of bench_rtf.py's reference implementations). A case whose peak
+memory, or whose relative time on the baseline's own host, exceeds the
+baseline by more than --tolerance fails the run (exit 1); relative-time
+regressions against another host's baseline are warnings. Comparing
+without a baseline file is an error (exit 2). The committed
+benchmarks/baseline.json was recorded with the default scales.
+
+Usage:
+    python benchmarks/run_suite.py --scale small medium --save-baseline
+    python benchmarks/run_suite.py --scale small medium          # compare
+    python benchmarks/run_suite.py --only rtf_escape --scale large
+
+The focused scripts next to this one (bench_rtf, bench_survey, bench_import)
+compare against reference implementations and stay as they are.
+"""
+import argparse
+import gc
+import json
+import math
+import platform
+import re
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+import matplotlib
+matplotlib.use('Agg')
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / 'scripts'))
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import corpora  # noqa: E402
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent / 'baseline.json'
+SCALES = {'small': 1, 'medium': 10, 'large': 100}
+
+# A case maps (size, tmp dir) -> (callable to time, units processed per call)
+Case = Callable[[int, Path], Tuple[Callable[[], object], float]]
+CASES: Dict[str, Tuple[str, int, Case]] = {}
+
+
+def case(name: str, unit: str, base_size: int):
+    def register(fn: Case) -> Case:
+        CASES[name] = (unit, base_size, fn)
+        return fn
+    return register
+
+
+@case('analyze_text', 'MB', 10_000)
+def _analyze_text(n, tmp):
+    from generate_a3_assessments import analyze_text
+    text = corpora.submission_text(n)
+    return (lambda: analyze_text(text)), len(text.encode('utf-8')) / 1e6
+
+
+@case('pptx_text', 'slides', 20)
+def _pptx_text(n, tmp):
+    from bounded_extract import pptx_text
+    path = corpora.write_pptx(tmp / f'deck_{n}.pptx', n)
+    return (lambda: pptx_text(path)), n
+
+
+@case('pdf_pypdf2', 'pages', 5)
+def _pdf_pypdf2(n, tmp):
+    from extract_pdf_text import extract_pages_from_pdf
+    path = corpora.write_pdf(tmp / f'doc_{n}.pdf', n)
+    return (lambda: sum(len(p) for p in extract_pages_from_pdf(path))), n
+
+
+@case('rtf_escape', 'MB', 100_000)
+def _rtf_escape(n, tmp):
+    from pptx_to_rtf import rtf_escape
+    lines = corpora.mixed_text(n).split('. ')
+    return (lambda: [rtf_escape(s) for s in lines]), n / 1e6
+
+
+@case('write_rtf', 'slides', 50)
+def _write_rtf(n, tmp):
+    from pptx_to_rtf import write_rtf
+    deck = corpora.slides(n)
+    return (lambda: write_rtf(deck, tmp / 'out.rtf')), n
+
+
+@case('simulate_building', 'rows', 10_000)
+def _simulate_building(n, tmp):
+    from data_simulation import simulate_building_performance
+    return (lambda: simulate_building_performance(n)), n
+
+
+@case('simulate_pilot', 'rows', 10_000)
+def _simulate_pilot(n, tmp):
+    from data_simulation import simulate_pilot_observations
+    return (lambda: simulate_pilot_observations(n)), n
+
+
+@case('simulate_survey', 'rows', 10_000)
+def _simulate_survey(n, tmp):
+    from data_simulation import simulate_survey_responses
+    return (lambda: simulate_survey_responses(n, seed_compatible=False)), n
+
+
+def _closing(fn):
+    import matplotlib.pyplot as plt
+
+    def run():
+        try:
+            return fn()
+        finally:
+            plt.close('all')
+    return run
+
+
+@case('plot_error_bars', 'rows', 10_000)
+def _plot_error_bars(n, tmp):
+    from data_simulation import simulate_building_performance
+    from plotting_utils import plot_error_bars
+    df = simulate_building_performance(n)
+    return _closing(lambda: plot_error_bars(df, 'orientation', 'eui_kwh_m2')), n
+
+
+@case('plot_binned_density', 'rows', 10_000)
+def _plot_binned_density(n, tmp):
+    from data_simulation import simulate_building_performance
+    from plotting_utils import plot_binned_density
+    df = simulate_building_performance(n)
+    return _closing(lambda: plot_binned_density(df, 'wwr', 'eui_kwh_m2', color='satisfaction_0_5')), n
+
+
+@case('plot_cv_folds', 'samples', 10_000)
+def _plot_cv_folds(n, tmp):
+    import numpy as np
+    from plotting_utils import plot_cv_folds
+    idx = np.arange(n)
+    splits = [(np.setdiff1d(idx, test), test) for test in np.array_split(idx, 5)]
+    return _closing(lambda: plot_cv_folds(n, splits)), n
+
+
+@case('token_frequencies', 'docs', 10_000)
+def _token_frequencies(n, tmp):
+    from data_simulation import simulate_survey_responses
+    from plotting_utils import token_frequencies
+    texts = simulate_survey_responses(n, seed_compatible=False)['response_text']
+    return (lambda: token_frequencies(texts, workers=1)), n
+
+
+MIN_ROUND_SECONDS = 0.1
+
+
+def reference_workload():
+    """Fixed mix of interpreter, string and numpy work that the relative timings are measured against."""
+    import numpy as np
+    words = [f'w{(i * 7919) % 5003}' for i in range(20_000)]
+    counts: Dict[str, int] = {}
+    for w in sorted(words):
+        counts[w] = counts.get(w, 0) + 1
+    ' '.join(words).upper().split()
+    np.sort(np.random.default_rng(0).random(200_000))
+    return len(counts)
+
+
+def _calls_per_round(fn: Callable[[], object]) -> int:
+    # Like timeit's autorange: enough calls for a round to last MIN_ROUND_SECONDS
+    t0 = time.perf_counter()
+    fn()
+    return max(1, math.ceil(MIN_ROUND_SECONDS / max(time.perf_counter() - t0, 1e-9)))
+
+
+def _round(fn: Callable[[], object], number: int) -> float:
+    gc.collect()
+    t0 = time.perf_counter()
+    for _ in range(number):
+        fn()
+    return (time.perf_counter() - t0) / number
+
+
+def measure(fn: Callable[[], object], repeat: int) -> Tuple[float, float, float]:
+    """(best seconds per call, median time relative to reference_workload, peak traced MB).
+
+    The first calls double as warm-up and calibration, so lazy imports and
+    caches filled on first use are not charged to the case. Each of the
+    `repeat` rounds times the case and then the reference back to back, so a
+    burst of host load slows both; the median of the per-round ratios is
+    what baselines are compared on.
+    """
+    n_ref, n_fn = _calls_per_round(reference_workload), _calls_per_round(fn)
+    best, ratios = float('inf'), []
+    for _ in range(repeat):
+        seconds = _round(fn, n_fn)
+        best = min(best, seconds)
+        ratios.append(seconds / _round(reference_workload, n_ref))
+    gc.collect()
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return best, statistics.median(ratios), peak / 1e6
+
+
+def run(names: List[str], scales: List[str], repeat: int) -> Dict[str, Dict]:
+    results = {}
+    print(f"{'case':<28}{'size':>10}{'seconds':>10}{'throughput':>22}{'relative':>10}{'peak MB':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in names:
+            unit, base, build = CASES[name]
+            for scale in scales:
+                size = base * SCALES[scale]
+                fn, units = build(size, Path(tmp))
+                seconds, relative, peak_mb = measure(fn, repeat)
+                key = f'{name}@{size}'
+                results[key] = {'unit': unit, 'seconds': seconds, 'throughput': units / seconds,
+                                'relative': relative, 'peak_mb': peak_mb}
+                print(f"{name:<28}{size:>10}{seconds:>10.4f}{units / seconds:>16,.1f} {unit + '/s':<6}"
+                      f"{relative:>9.3f}{peak_mb:>10.1f}")
+    return results
+
+
+def compare(results: Dict[str, Dict], baseline: Dict[str, Dict], tolerance: float,
+            mem_slack_mb: float = 1.0) -> Tuple[List[str], List[str]]:
+    """(time regressions, memory regressions) beyond `tolerance`, as readable lines.
+
+    Time is judged on the reference-relative figure only; throughput is
+    reported for context.
+    """
+    slower, bigger = [], []
+    for key, res in results.items():
+        base = baseline.get(key)
+        if base is None:
+            continue
+        if 'relative' in base and res['relative'] > base['relative'] * (1 + tolerance):
+            slower.append(f"{key}: {res['relative']:.3f} x reference vs baseline {base['relative']:.3f} "
+                          f"({res['throughput']:,.1f} vs {base['throughput']:,.1f} {res['unit']}/s)")
+        if res['peak_mb'] > base['peak_mb'] * (1 + tolerance) + mem_slack_mb:
+            bigger.append(f"{key}: peak {res['peak_mb']:.1f} MB vs baseline {base['peak_mb']:.1f} MB")
+    return slower, bigger
+
+
+def host() -> str:
+    return f'{platform.node()} {platform.machine()} Python {platform.python_version()}'
+
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--scale', nargs='+', choices=list(SCALES), default=['small', 'medium'])
+    parser.add_argument('--only', default=None, help='regex selecting case names')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--baseline', type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument('--save-baseline', action='store_true',
+                        help='merge these results into the baseline file instead of comparing')
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='allowed relative slowdown / memory growth before failing')
+    args = parser.parse_args()
+
+    names = [n for n in CASES if args.only is None or re.search(args.only, n)]
+    if not names:
+        parser.error(f'no case matches {args.only!r}; cases: {", ".join(CASES)}')
+    results = run(names, args.scale, args.repeat)
+
+    stored = json.loads(args.baseline.read_text(encoding='utf-8')) if args.baseline.exists() else {}
+    if args.save_baseline:
+        stored.setdefault('results', {}).update(results)
+        stored['machine'] = host()
+        args.baseline.write_text(json.dumps(stored, indent=2, sort_keys=True), encoding='utf-8')
+        print(f'\nBaseline saved to {args.baseline}')
+        return
+    if not stored:
+        print(f'\nNo baseline at {args.baseline}; run with --save-baseline to create one', file=sys.stderr)
+        sys.exit(2)
+    slower, bigger = compare(results, stored.get('results', {}), args.tolerance)
+    # Relative timings still shift between CPUs and Python builds, so they only
+    # fail the run against a baseline recorded on this host; memory always does.
+    same_host = stored.get('machine') == host()
+    failures = bigger + (slower if same_host else [])
+    if slower and not same_host:
+        print(f"\nSlower than baseline (warning only: baseline is from {stored.get('machine', '?')}, "
+              f"this is {host()}; re-save to gate on time):")
+        for p in slower:
+            print(f'  {p}')
+    if failures:
+        print(f"\nREGRESSIONS (tolerance {args.tolerance:.0%}, baseline from {stored.get('machine', '?')}):")
+        for p in failures:
+            print(f'  {p}')
+        sys.exit(1)
+    print(f'\nNo regressions against {args.baseline}')
+
+
+if __name__ == '__main__':
+    main()
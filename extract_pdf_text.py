@@ -1,67 +1,224 @@
 #!/usr/bin/env python3
 """
 Extract text from PDF files in the A3 directory for assessment purposes.
+
+Extraction runs in a process pool and keeps a manifest (keyed by file path,
+size and mtime) in the output directory, so unchanged PDFs are skipped on
+re-runs and an interrupted batch resumes where it stopped. The manifest also
+records whether page files were written, so a --per-page run re-extracts
+PDFs that an earlier run extracted without them.
 """
 
+import argparse
+import json
 import os
+import sys
 import PyPDF2
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 
+# The helpers in scripts/ import each other by bare name; do the same here so
+# each module (and DEFAULT_CACHE) is loaded once per process
+sys.path.insert(0, str(Path(__file__).resolve().parent / "scripts"))
+
+from pipeline_trace import Trace, profiled  # noqa: E402
+from text_cache import DEFAULT_CACHE  # noqa: E402
+
+A3_DIR = Path("/Users/guo/tprojs/ARCH7476/A3")
+OUTPUT_DIR = A3_DIR / "extracted_text"
+MANIFEST_NAME = "manifest.json"
+
+def extract_pages_from_pdf(pdf_path):
+    """Yield the text of each page of a PDF file using PyPDF2"""
+    with open(pdf_path, 'rb') as file:
+        pdf_reader = PyPDF2.PdfReader(file)
+        for page in pdf_reader.pages:
+            yield page.extract_text()
+
 def extract_text_from_pdf(pdf_path):
     """Extract text from a PDF file using PyPDF2"""
+    def extract(path):
+        # Join once at the end; repeated += is quadratic on long documents
+        return "".join(page + "\n" for page in extract_pages_from_pdf(path))
+
     try:
-        with open(pdf_path, 'rb') as file:
-            pdf_reader = PyPDF2.PdfReader(file)
-            text = ""
-            
-            # Extract text from all pages
-            for page_num in range(len(pdf_reader.pages)):
-                page = pdf_reader.pages[page_num]
-                text += page.extract_text() + "\n"
-            
-            return text
+        return DEFAULT_CACHE.fetch(Path(pdf_path), "pypdf2", PyPDF2.__version__, extract)
     except Exception as e:
         return f"Error extracting text from {pdf_path}: {str(e)}"
 
-def process_a3_submissions():
-    """Process all PDF files in the A3 directory"""
-    
-    # Define paths
-    a3_dir = Path("/Users/guo/tprojs/ARCH7476/A3")
-    output_dir = Path("/Users/guo/tprojs/ARCH7476/A3/extracted_text")
-    
+def file_signature(path):
+    """Return the (size, mtime) pair used to detect changed files"""
+    st = os.stat(path)
+    return {"size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+def load_manifest(output_dir):
+    manifest_path = Path(output_dir) / MANIFEST_NAME
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_manifest(output_dir, manifest):
+    """Write the manifest atomically so an interrupted run never corrupts it"""
+    manifest_path = Path(output_dir) / MANIFEST_NAME
+    tmp_path = manifest_path.with_suffix('.json.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, manifest_path)
+
+def is_up_to_date(pdf_file, output_dir, manifest, per_page=False):
+    entry = manifest.get(str(pdf_file))
+    if entry is None:
+        return False
+    if not (Path(output_dir) / entry["output"]).exists():
+        return False
+    # A file extracted without --per-page has no page files yet
+    if per_page and not (entry.get("per_page") and (Path(output_dir) / entry["pages_dir"]).is_dir()):
+        return False
+    sig = file_signature(pdf_file)
+    return entry["size"] == sig["size"] and entry["mtime_ns"] == sig["mtime_ns"]
+
+def extract_to_file(pdf_file, output_dir, per_page=False):
+    """Extract one PDF and write its text chunk by chunk.
+
+    Runs inside a worker process. Output is written to a temporary file and
+    renamed into place, so a killed worker never leaves a half-written file
+    that a later run would mistake for a finished one.
+
+    Returns (output_filename, page_count, error, trace_records); the records
+    hold the worker-side wall/CPU time and bytes written for this file.
+    """
+    pdf_file = Path(pdf_file)
+    output_dir = Path(output_dir)
+    output_filename = pdf_file.stem + "_extracted.txt"
+    output_path = output_dir / output_filename
+    tmp_path = output_path.with_suffix('.txt.part')
+    pages_dir = output_dir / (pdf_file.stem + "_pages")
+    page_count = 0
+    error = None
+    trace = Trace()
+
+    with trace.stage(pdf_file.name, "extract") as rec, open(tmp_path, 'w', encoding='utf-8') as output_file:
+        output_file.write(f"=== EXTRACTED TEXT FROM: {pdf_file.name} ===\n\n")
+        try:
+            if per_page:
+                pages_dir.mkdir(exist_ok=True)
+            for page_num, page_text in enumerate(extract_pages_from_pdf(pdf_file), start=1):
+                output_file.write(page_text)
+                output_file.write("\n")
+                if per_page:
+                    page_path = pages_dir / f"page_{page_num:04d}.txt"
+                    page_path.write_text(page_text, encoding='utf-8')
+                page_count = page_num
+        except Exception as e:
+            error = f"Error extracting text from {pdf_file}: {str(e)}"
+            output_file.write(error)
+            rec["error"] = error
+        rec["pages"] = page_count
+        rec["bytes"] = output_file.tell()
+
+    os.replace(tmp_path, output_path)
+    return output_filename, page_count, error, trace.records
+
+def process_a3_submissions(a3_dir=A3_DIR, output_dir=OUTPUT_DIR, workers=None, per_page=False, force=False,
+                           trace=None):
+    """Process all PDF files in the A3 directory
+
+    Parameters
+    ----------
+    a3_dir: directory containing the submitted PDFs
+    output_dir: where extracted text and the manifest are written
+    workers: number of worker processes (default: os.cpu_count(); 1 runs serially)
+    per_page: also write one text file per page under <stem>_pages/
+    force: ignore the manifest and re-extract every file
+    trace: optional pipeline_trace.Trace that receives per-file timings
+    """
+    a3_dir = Path(a3_dir)
+    output_dir = Path(output_dir)
+
     # Create output directory if it doesn't exist
-    output_dir.mkdir(exist_ok=True)
-    
+    output_dir.mkdir(parents=True, exist_ok=True)
+
     # Find all PDF files in A3 directory
-    pdf_files = list(a3_dir.glob("*.pdf"))
-    
+    pdf_files = sorted(a3_dir.glob("*.pdf"))
+
     print(f"Found {len(pdf_files)} PDF files to process")
-    
+
+    manifest = {} if force else load_manifest(output_dir)
+    pending = []
     for pdf_file in pdf_files:
-        print(f"Processing: {pdf_file.name}")
-        
-        # Extract text
-        extracted_text = extract_text_from_pdf(pdf_file)
-        
-        # Create output filename
-        output_filename = pdf_file.stem + "_extracted.txt"
-        output_path = output_dir / output_filename
-        
-        # Save extracted text
-        try:
-            with open(output_path, 'w', encoding='utf-8') as output_file:
-                output_file.write(f"=== EXTRACTED TEXT FROM: {pdf_file.name} ===\n\n")
-                output_file.write(extracted_text)
-            
-            print(f"✓ Saved: {output_filename}")
-            
-        except Exception as e:
-            print(f"✗ Error saving {output_filename}: {str(e)}")
-    
+        if is_up_to_date(pdf_file, output_dir, manifest, per_page):
+            print(f"- Unchanged, skipping: {pdf_file.name}")
+        else:
+            pending.append(pdf_file)
+
+    def record(pdf_file, result):
+        output_filename, page_count, error, records = result
+        if trace is not None:
+            trace.extend(records)
+        if error:
+            print(f"✗ {error}")
+            # Leave failed files out of the manifest so they are retried
+            manifest.pop(str(pdf_file), None)
+        else:
+            manifest[str(pdf_file)] = dict(file_signature(pdf_file), output=output_filename, pages=page_count,
+                                           per_page=per_page, pages_dir=pdf_file.stem + "_pages")
+            print(f"✓ Saved: {output_filename} ({page_count} pages)")
+        # Persist after every file so an interrupted batch can resume
+        save_manifest(output_dir, manifest)
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(pending) <= 1:
+        for pdf_file in pending:
+            print(f"Processing: {pdf_file.name}")
+            try:
+                record(pdf_file, extract_to_file(pdf_file, output_dir, per_page))
+            except Exception as e:
+                print(f"✗ Error saving {pdf_file.stem}_extracted.txt: {str(e)}")
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(extract_to_file, pdf_file, output_dir, per_page): pdf_file
+                       for pdf_file in pending}
+            for future in as_completed(futures):
+                pdf_file = futures[future]
+                try:
+                    record(pdf_file, future.result())
+                except Exception as e:
+                    print(f"✗ Error saving {pdf_file.stem}_extracted.txt: {str(e)}")
+
     print(f"\nText extraction complete. Files saved to: {output_dir}")
     return output_dir
 
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Extract text from A3 PDF submissions")
+    parser.add_argument("--a3-dir", type=Path, default=A3_DIR)
+    parser.add_argument("--output-dir", type=Path, default=None,
+                        help="defaults to <a3-dir>/extracted_text")
+    parser.add_argument("-j", "--workers", type=int, default=None,
+                        help="worker processes (default: CPU count)")
+    parser.add_argument("--per-page", action="store_true", help="also write one file per page")
+    parser.add_argument("--force", action="store_true", help="re-extract unchanged files")
+    parser.add_argument("--trace", type=Path, default=None,
+                        help="write per-file timings to this .json or .csv file")
+    parser.add_argument("--profile", type=Path, default=None,
+                        help="write cProfile stats here (covers worker code only with -j 1)")
+    return parser.parse_args(argv)
+
 if __name__ == "__main__":
-    output_directory = process_a3_submissions()
-    print(f"\nNext step: Check the extracted text files in {output_directory}")
\ No newline at end of file
+    args = parse_args()
+    trace = Trace()
+    with profiled(args.profile):
+        output_directory = process_a3_submissions(
+            a3_dir=args.a3_dir,
+            output_dir=args.output_dir or args.a3_dir / "extracted_text",
+            workers=args.workers,
+            per_page=args.per_page,
+            force=args.force,
+            trace=trace,
+        )
+    if args.trace:
+        trace.write(args.trace)
+        trace.print_summary()
+        print(f"Trace written to {args.trace}")
+    print(f"\nNext step: Check the extracted text files in {output_directory}")
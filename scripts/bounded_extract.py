@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""Text extraction with a per-file time/memory budget and a fallback chain.
+
+Each document type has an ordered chain of extractors, e.g. for PDFs
+pdftotext -> PyPDF2 -> PyPDF2 on the first N pages. Every attempt runs in a
+child process (the external tool itself, or a forkserver worker for the
+Python extractors) that is killed when its share of the budget runs out and
+is capped by RLIMIT_AS where the platform supports it. An attempt that fails,
+times out or returns only whitespace hands over to the next one.
+
+Each attempt gets an equal share of whatever budget is left, so time that an
+early extractor does not use passes to the later ones. The total time per
+file therefore stays within the budget, however pathological the file.
+"""
+from __future__ import annotations
+
+import multiprocessing as mp
+import os
+import signal
+import subprocess
+import sys
+import time
+import zipfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+try:
+    import resource
+except ImportError:  # Windows: no memory caps
+    resource = None
+
+from pptx_to_rtf import iter_slide_paragraphs, xml_paragraphs
+
+
+@dataclass
+class Budget:
+    seconds: float = 60.0       # wall time for the whole chain, per file
+    memory_mb: int = 2048       # address-space cap per attempt (POSIX only)
+    fallback_pages: int = 20    # pages kept by the last-resort PDF extractor
+
+
+@dataclass
+class Attempt:
+    extractor: str
+    status: str                 # 'ok', 'empty', 'timeout', 'error'
+    seconds: float
+    exit_code: Optional[int] = None
+    error: Optional[str] = None
+
+
+@dataclass
+class ExtractionResult:
+    text: str
+    extractor: Optional[str]    # winning extractor, None if every attempt failed
+    seconds: float
+    complete: bool              # False when only part of the document was read
+    attempts: List[Attempt] = field(default_factory=list)
+    no_text: bool = False       # every extractor ran and found only whitespace
+
+    def describe(self) -> str:
+        """Compact one-line attempt log, e.g. 'pdftotext:timeout(20.0s);pypdf2:ok(1.3s)'."""
+        return ';'.join(f'{a.extractor}:{a.status}({a.seconds:.1f}s)' for a in self.attempts)
+
+
+class ExtractionTimeout(Exception):
+    pass
+
+
+def _memory_cap(memory_mb: int) -> List[str]:
+    """Command prefix that execs the tool under an address-space limit.
+
+    Only needed where resource.prlimit is missing (e.g. macOS); on Linux
+    run_tool sets the limit on the child directly.
+    """
+    if resource is None or not memory_mb or hasattr(resource, 'prlimit'):
+        return []
+    limit = memory_mb * 1024 * 1024
+    # A tiny trampoline rather than preexec_fn, which is unsafe with threads
+    return [sys.executable, '-c',
+            f'import os, resource, sys; resource.setrlimit(resource.RLIMIT_AS, ({limit}, {limit})); '
+            'os.execvp(sys.argv[1], sys.argv[1:])']
+
+
+def run_tool(cmd: List[str], timeout: float, memory_mb: int) -> Tuple[str, int]:
+    """Run an external extractor; return (stdout text, exit code)."""
+    # Own process group, so a timeout also kills anything the tool spawned
+    # (a wrapper script's children would otherwise keep the pipes open)
+    with subprocess.Popen(_memory_cap(memory_mb) + cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                          start_new_session=os.name == 'posix') as proc:
+        if memory_mb and resource is not None and hasattr(resource, 'prlimit'):
+            limit = memory_mb * 1024 * 1024
+            try:
+                resource.prlimit(proc.pid, resource.RLIMIT_AS, (limit, limit))
+            except OSError:  # already exited
+                pass
+        try:
+            stdout, stderr = proc.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired as e:
+            if os.name == 'posix':
+                os.killpg(proc.pid, signal.SIGKILL)
+            else:
+                proc.kill()
+            proc.communicate()
+            raise ExtractionTimeout(f'{cmd[0]} exceeded {timeout:.1f}s') from e
+    if proc.returncode:
+        err = stderr.decode('utf-8', errors='ignore').strip().splitlines()
+        raise subprocess.CalledProcessError(proc.returncode, cmd, stderr=err[-1] if err else '')
+    return stdout.decode('utf-8', errors='ignore'), proc.returncode
+
+
+def _child_main(conn, fn: Callable, args: tuple, memory_mb: int) -> None:
+    if resource is not None and memory_mb:
+        limit = memory_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    try:
+        conn.send((True, fn(*args)))
+    except BaseException as e:
+        conn.send((False, f'{type(e).__name__}: {e}'))
+    finally:
+        conn.close()
+
+
+def _mp_context():
+    methods = mp.get_all_start_methods()
+    return mp.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+
+
+def run_in_child(fn: Callable, args: tuple, timeout: float, memory_mb: int):
+    """Call a top-level function in a separate process, killing it after `timeout`."""
+    ctx = _mp_context()
+    recv, send = ctx.Pipe(duplex=False)
+    proc = ctx.Process(target=_child_main, args=(send, fn, args, memory_mb), daemon=True)
+    proc.start()
+    send.close()
+    try:
+        if not recv.poll(timeout):
+            raise ExtractionTimeout(f'{getattr(fn, "__name__", fn)} exceeded {timeout:.1f}s')
+        try:
+            ok, value = recv.recv()
+        except EOFError:
+            raise RuntimeError('extractor process died (memory cap or crash)') from None
+    finally:
+        if proc.is_alive():
+            proc.kill()
+        proc.join()
+        recv.close()
+    if not ok:
+        raise RuntimeError(value)
+    return value
+
+
+# --- extractors (top level so they can run in child processes) -------------
+
+def pdftotext_text(path: Path, timeout: float, budget: Budget) -> str:
+    return run_tool(['pdftotext', '-layout', '-nopgbrk', '-enc', 'UTF-8', str(path), '-'], timeout, budget.memory_mb)[0]
+
+
+def pandoc_text(path: Path, timeout: float, budget: Budget) -> str:
+    return run_tool(['pandoc', str(path), '-t', 'markdown'], timeout, budget.memory_mb)[0]
+
+
+def _pypdf2_pages(path: Path, max_pages: Optional[int]) -> str:
+    import PyPDF2
+
+    with open(path, 'rb') as f:
+        reader = PyPDF2.PdfReader(f)
+        pages = reader.pages if max_pages is None else reader.pages[:max_pages]
+        return ''.join((page.extract_text() or '') + '\n' for page in pages)
+
+
+def pypdf2_text(path: Path, timeout: float, budget: Budget) -> str:
+    return run_in_child(_pypdf2_pages, (path, None), timeout, budget.memory_mb)
+
+
+def pypdf2_first_pages_text(path: Path, timeout: float, budget: Budget) -> str:
+    return run_in_child(_pypdf2_pages, (path, budget.fallback_pages), timeout, budget.memory_mb)
+
+
+def pptx_text(path: Path) -> str:
+    return '\n\n'.join('\n'.join(paras) for paras in iter_slide_paragraphs(path) if paras)
+
+
+def _docx_xml(path: Path) -> str:
+    with zipfile.ZipFile(path) as z, z.open('word/document.xml') as f:
+        return '\n'.join(xml_paragraphs(f))
+
+
+def pptx_xml_text(path: Path, timeout: float, budget: Budget) -> str:
+    # Small archives can still hold huge XML parts, so these are bounded too
+    return run_in_child(pptx_text, (path,), timeout, budget.memory_mb)
+
+
+def docx_xml_text(path: Path, timeout: float, budget: Budget) -> str:
+    return run_in_child(_docx_xml, (path,), timeout, budget.memory_mb)
+
+
+# suffix -> [(name, extractor, reads the whole document)]
+CHAINS: Dict[str, List[Tuple[str, Callable, bool]]] = {
+    '.pdf': [('pdftotext', pdftotext_text, True), ('pypdf2', pypdf2_text, True),
+             ('pypdf2-first-pages', pypdf2_first_pages_text, False)],
+    '.docx': [('pandoc', pandoc_text, True), ('docx-xml', docx_xml_text, True)],
+    '.pptx': [('pptx-xml', pptx_xml_text, True)],
+}
+
+
+def extract_bounded(path: Path, budget: Optional[Budget] = None) -> ExtractionResult:
+    """Run the fallback chain for `path` within `budget`; never raises for extraction failures."""
+    budget = budget or Budget()
+    chain = CHAINS[path.suffix.lower()]
+    t0 = time.perf_counter()
+    attempts: List[Attempt] = []
+    for i, (name, extractor, complete) in enumerate(chain):
+        remaining = budget.seconds - (time.perf_counter() - t0)
+        if remaining <= 0:
+            break
+        share = remaining / (len(chain) - i)
+        start = time.perf_counter()
+        exit_code = error = None
+        try:
+            text = extractor(path, share, budget)
+            status = 'ok' if text.strip() else 'empty'
+            exit_code = 0 if name in ('pdftotext', 'pandoc') else None
+        except ExtractionTimeout as e:
+            status, error = 'timeout', str(e)
+        except subprocess.CalledProcessError as e:
+            status, exit_code, error = 'error', e.returncode, f'exit {e.returncode}: {e.stderr}'
+        except Exception as e:
+            status, error = 'error', f'{type(e).__name__}: {e}'
+        attempts.append(Attempt(name, status, time.perf_counter() - start, exit_code, error))
+        if status == 'ok':
+            return ExtractionResult(text, name, time.perf_counter() - t0, complete, attempts)
+    no_text = len(attempts) == len(chain) and all(a.status == 'empty' for a in attempts)
+    return ExtractionResult('', None, time.perf_counter() - t0, False, attempts, no_text)
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""Cohort-wide rubric analysis over all A3 submissions at once.
+
+All lower-cased texts are joined with a separator that no rubric term
+contains and scanned by the rubric automaton in a single pass; every match
+is assigned to its document by its offset, giving a sparse document x term
+count matrix. Category scores and estimated grades for the whole cohort
+then come from array operations on that matrix and agree with
+generate_a3_assessments.analyze_text submission by submission.
+
+Usage: python scripts/cohort_analysis.py [A3_DIR] [-o cohort.parquet] [--terms terms.parquet] [-j N]
+"""
+from __future__ import annotations
+
+import argparse
+import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from generate_a3_assessments import (
+    APPROACH_TOKENS, COMM, DOC, PILOT, RDQ, RUBRIC, SCORE_WEIGHTS,
+    detect_name_from_filename, extract_text, list_submissions,
+)
+
+CATEGORIES = {'rdq': RDQ, 'pilot': PILOT, 'doc': DOC, 'comm': COMM}
+SEPARATOR = '\x00'
+
+
+@dataclass
+class CohortAnalysis:
+    names: List[str]
+    terms: List[str]
+    counts: sparse.csr_matrix  # documents x terms, match counts
+    scores: pd.DataFrame       # one row per document
+
+    def term_frame(self) -> pd.DataFrame:
+        """The count matrix as a sparse-backed DataFrame (documents x terms)."""
+        return pd.DataFrame.sparse.from_spmatrix(self.counts, index=self.names, columns=self.terms)
+
+    def term_usage(self) -> pd.DataFrame:
+        """Per term: how many submissions use it and how often in total, rarest first."""
+        present = (self.counts > 0).astype(np.int64)
+        usage = pd.DataFrame({
+            'documents': np.asarray(present.sum(axis=0)).ravel(),
+            'occurrences': np.asarray(self.counts.sum(axis=0)).ravel(),
+        }, index=pd.Index(self.terms, name='term'))
+        usage['share'] = usage['documents'] / max(len(self.names), 1)
+        return usage.sort_values(['documents', 'occurrences'])
+
+    def term_long(self) -> pd.DataFrame:
+        """Non-zero matrix entries as (name, term, count) rows."""
+        coo = self.counts.tocoo()
+        return pd.DataFrame({
+            'name': np.asarray(self.names, dtype=object)[coo.row],
+            'term': np.asarray(self.terms, dtype=object)[coo.col],
+            'count': coo.data,
+        })
+
+    def to_parquet(self, path, terms_path=None) -> None:
+        """Write the per-submission scores and, optionally, the long-format term counts."""
+        self.scores.to_parquet(path, index=False)
+        if terms_path is not None:
+            self.term_long().to_parquet(terms_path, index=False)
+
+
+def _membership(groups: Dict[str, Sequence[str]], terms: List[str]) -> np.ndarray:
+    """terms x groups 0/1 matrix; a term may belong to several groups."""
+    col = {t: j for j, t in enumerate(terms)}
+    m = np.zeros((len(terms), len(groups)), dtype=np.int64)
+    for g, toks in enumerate(groups.values()):
+        for t in toks:
+            m[col[t], g] = 1
+    return m
+
+
+def term_matrix(texts: Sequence[str]) -> sparse.csr_matrix:
+    """Documents x RUBRIC.keywords match counts from one scan of the whole cohort."""
+    lowered = [t.lower() for t in texts]
+    kw_idx, ends = RUBRIC.matches(SEPARATOR.join(lowered))
+    # Offset of each document's first character in the joined text
+    starts = np.cumsum([0] + [len(t) + len(SEPARATOR) for t in lowered[:-1]])
+    docs = np.searchsorted(starts, np.asarray(ends, dtype=np.int64), side='right') - 1
+    counts = sparse.coo_matrix(
+        (np.ones(len(kw_idx), dtype=np.int64), (docs, np.asarray(kw_idx, dtype=np.int64))),
+        shape=(len(texts), len(RUBRIC.keywords)),
+    )
+    return counts.tocsr()  # duplicate (doc, term) pairs are summed here
+
+
+def analyze_cohort(texts: Sequence[str], names: Optional[Sequence[str]] = None) -> CohortAnalysis:
+    """Scores, estimated grades and approach flags for every text, from the term matrix."""
+    names = list(names) if names is not None else [str(i) for i in range(len(texts))]
+    terms = list(RUBRIC.keywords)
+    counts = term_matrix(texts)
+    present = (counts > 0).astype(np.int64)
+
+    hits = present @ _membership(CATEGORIES, terms)
+    # 'heading' also counts as present when the text has more than two markdown headings
+    headings = np.array([len(re.findall(r'^(#+)\s', t, flags=re.MULTILINE)) for t in texts], dtype=np.int64)
+    comm = list(CATEGORIES).index('comm')
+    heading_col = terms.index('heading')
+    hits[:, comm] += (headings > 2) & (present[:, [heading_col]].toarray().ravel() == 0)
+    sizes = np.array([len(toks) for toks in CATEGORIES.values()], dtype=float)
+    scores = hits / sizes
+
+    word_count = np.array([len(re.findall(r'\w+', t)) for t in texts], dtype=np.int64)
+    # Same thresholds as analyze_text: short submissions are scaled down
+    length_factor = np.select([word_count < 500, word_count < 800], [0.8, 0.9], default=1.0)
+    # Summed column by column in analyze_text's order, so rounding matches exactly
+    raw = sum(scores[:, j] * SCORE_WEIGHTS[c] for j, c in enumerate(CATEGORIES))
+    grade = np.round(raw * length_factor).astype(np.int64)
+
+    approaches = (present @ _membership(APPROACH_TOKENS, terms)) > 0
+    df = pd.DataFrame({'name': names, 'word_count': word_count})
+    for j, c in enumerate(CATEGORIES):
+        df[c] = scores[:, j]
+    df['estimated_grade'] = grade
+    for j, a in enumerate(APPROACH_TOKENS):
+        df[f"approach_{a.replace(' ', '_')}"] = approaches[:, j]
+    return CohortAnalysis(names=names, terms=terms, counts=counts, scores=df)
+
+
+def analyze_submissions(a3_dir: Optional[Path] = None, jobs: Optional[int] = None) -> CohortAnalysis:
+    files = list_submissions(a3_dir)
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        texts = list(pool.map(extract_text, files))
+    return analyze_cohort(texts, [detect_name_from_filename(f.name) for f in files])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Cohort-wide rubric term matrix and scores')
+    parser.add_argument('a3_dir', nargs='?', type=Path, default=None)
+    parser.add_argument('-o', '--output', type=Path, default=None, help='write per-submission scores (.parquet or .csv)')
+    parser.add_argument('--terms', type=Path, default=None, help='write long-format term counts (.parquet)')
+    parser.add_argument('-j', '--jobs', type=int, default=None, help='concurrent extractions (default: CPU count)')
+    args = parser.parse_args(argv)
+
+    cohort = analyze_submissions(args.a3_dir, args.jobs)
+    print(f'{len(cohort.names)} submissions, {cohort.counts.nnz} non-zero term counts')
+    print(cohort.scores[list(CATEGORIES) + ['estimated_grade']].describe().round(2).to_string())
+    print('\nLeast used rubric terms:')
+    print(cohort.term_usage().head(10).to_string())
+    if args.output and args.output.suffix == '.csv':
+        cohort.scores.to_csv(args.output, index=False)
+    elif args.output:
+        cohort.scores.to_parquet(args.output, index=False)
+    if args.terms:
+        cohort.term_long().to_parquet(args.terms, index=False)
+    for path in filter(None, [args.output, args.terms]):
+        print(f'Wrote {path}')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,24 +1,54 @@
 from __future__ import annotations
 
+import asyncio
+import copy
 import os
+import shutil
+import string
+import tempfile
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Tuple
+from typing import TYPE_CHECKING, AsyncIterator, Deque, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
 
+if TYPE_CHECKING:  # pragma: no cover
+    import pyarrow as pa
+
 
 RNG = np.random.default_rng(42)
 
 
-def simulate_building_performance(n: int = 200, random_state: int = 42) -> pd.DataFrame:
-    rng = np.random.default_rng(random_state)
-    wwr = rng.uniform(0.2, 0.85, size=n)
-    shading_depth_m = rng.uniform(0.0, 1.2, size=n)
-    orientation = rng.choice(["N", "E", "S", "W"], size=n)
-    glazing_u = rng.uniform(1.2, 3.0, size=n)
-    climate = rng.choice(["subtropical", "temperate"], size=n, p=[0.7, 0.3])
+# Random draws behind simulate_building_performance, in stream order. Each
+# column consumes `size` variates from the shared generator before the next
+# column starts, which is what lets the chunked generator reproduce it.
+_BUILDING_DRAWS = [
+    ("wwr", lambda rng, size: rng.uniform(0.2, 0.85, size=size)),
+    ("shading_depth_m", lambda rng, size: rng.uniform(0.0, 1.2, size=size)),
+    ("orientation", lambda rng, size: rng.choice(["N", "E", "S", "W"], size=size)),
+    ("glazing_u", lambda rng, size: rng.uniform(1.2, 3.0, size=size)),
+    ("climate", lambda rng, size: rng.choice(["subtropical", "temperate"], size=size, p=[0.7, 0.3])),
+    ("cooling_noise", lambda rng, size: rng.normal(0, 10, size)),
+    ("heating_noise", lambda rng, size: rng.normal(0, 5, size)),
+    ("eui_noise", lambda rng, size: rng.normal(0, 8, size)),
+    ("daylit_noise", lambda rng, size: rng.normal(0, 0.05, size)),
+    ("glare_noise", lambda rng, size: rng.normal(0, 0.05, size)),
+    ("occupancy_density", lambda rng, size: rng.uniform(10, 45, size)),
+    ("noise_db_noise", lambda rng, size: rng.normal(0, 3, size)),
+    ("satisfaction_noise", lambda rng, size: rng.normal(0, 0.2, size)),
+]
+
+
+def _building_frame(d: Dict[str, np.ndarray], index: Optional[pd.RangeIndex] = None) -> pd.DataFrame:
+    wwr = d["wwr"]
+    shading_depth_m = d["shading_depth_m"]
+    orientation = d["orientation"]
+    glazing_u = d["glazing_u"]
+    climate = d["climate"]
     # Simple physics-inspired patterns
     solar_gain = (wwr * (1 - np.clip(shading_depth_m / 1.2, 0, 1)))
     orient_factor = np.select(
@@ -27,14 +57,14 @@ def simulate_building_performance(n: int = 200, random_state: int = 42) -> pd.Da
         default=1.0,
     )
     climate_coolmult = np.where(climate == "subtropical", 1.0, 0.85)
-    cooling_kwh_m2 = 80 + 220 * solar_gain * orient_factor * climate_coolmult + rng.normal(0, 10, n)
-    heating_kwh_m2 = np.clip(40 + (3.2 - glazing_u) * 22 + rng.normal(0, 5, n), 0, None)
-    eui = cooling_kwh_m2 + heating_kwh_m2 + rng.normal(0, 8, n)
-    daylit_area = np.clip(0.3 + 0.9 * wwr - 0.35 * shading_depth_m + rng.normal(0, 0.05, n), 0, 1)
-    glare_probability = np.clip(0.55 * wwr - 0.3 * shading_depth_m + rng.normal(0, 0.05, n) + (orientation == "W") * 0.05, 0, 1)
-    occupancy_density = rng.uniform(10, 45, n)
-    noise_db = np.clip(35 + 0.4 * occupancy_density + rng.normal(0, 3, n), 30, 80)
-    satisfaction = np.clip(4.7 - 0.008 * eui + 0.6 * daylit_area - 0.7 * glare_probability + rng.normal(0, 0.2, n), 1.5, 4.9)
+    cooling_kwh_m2 = 80 + 220 * solar_gain * orient_factor * climate_coolmult + d["cooling_noise"]
+    heating_kwh_m2 = np.clip(40 + (3.2 - glazing_u) * 22 + d["heating_noise"], 0, None)
+    eui = cooling_kwh_m2 + heating_kwh_m2 + d["eui_noise"]
+    daylit_area = np.clip(0.3 + 0.9 * wwr - 0.35 * shading_depth_m + d["daylit_noise"], 0, 1)
+    glare_probability = np.clip(0.55 * wwr - 0.3 * shading_depth_m + d["glare_noise"] + (orientation == "W") * 0.05, 0, 1)
+    occupancy_density = d["occupancy_density"]
+    noise_db = np.clip(35 + 0.4 * occupancy_density + d["noise_db_noise"], 30, 80)
+    satisfaction = np.clip(4.7 - 0.008 * eui + 0.6 * daylit_area - 0.7 * glare_probability + d["satisfaction_noise"], 1.5, 4.9)
 
     df = pd.DataFrame(
         {
@@ -51,21 +81,161 @@ def simulate_building_performance(n: int = 200, random_state: int = 42) -> pd.Da
             "occupancy_density_p_per_100m2": occupancy_density,
             "satisfaction_0_5": satisfaction,
             "noise_db": noise_db,
-        }
+        },
+        index=index,
     )
     return df
 
 
-def simulate_pilot_observations(n: int = 120, random_state: int = 7) -> pd.DataFrame:
+def simulate_building_performance(n: int = 200, random_state: int = 42) -> pd.DataFrame:
+    rng = np.random.default_rng(random_state)
+    return _building_frame({name: draw(rng, n) for name, draw in _BUILDING_DRAWS})
+
+
+def _column_streams(draws, n: int, random_state: int, chunk_size: int) -> List[np.random.Generator]:
+    """One generator per column, each positioned where that column starts in the
+    single-shot stream. Earlier columns are fast-forwarded chunk by chunk, so
+    memory stays O(chunk_size)."""
     rng = np.random.default_rng(random_state)
-    t = pd.date_range("2025-03-01 09:00", periods=n, freq="10min")
-    cond = np.where(np.arange(n) % 2 == 0, "A", "B")
-    base_occ = 20 + 8 * np.sin(np.linspace(0, 3.5 * np.pi, n))
-    occupancy = np.clip(base_occ + (cond == "B") * 3 + rng.normal(0, 2.5, n), 0, None).astype(int)
-    dwell_mean = np.clip(6 + (cond == "B") * 1.2 + rng.normal(0, 1.0, n), 1, None)
-    dwell_std = np.clip(1.2 + rng.normal(0, 0.3, n), 0.2, None)
-    temp_c = 23 + 2 * np.sin(np.linspace(0, 2 * np.pi, n)) + rng.normal(0, 0.5, n)
-    humidity = np.clip(55 + 5 * np.cos(np.linspace(0, 2.2 * np.pi, n)) + rng.normal(0, 2, n), 35, 85)
+    streams = []
+    for _, draw in draws:
+        streams.append(copy.deepcopy(rng))
+        for start in range(0, n, chunk_size):
+            draw(rng, min(chunk_size, n - start))
+    return streams
+
+
+def _to_arrow(df: pd.DataFrame):
+    try:
+        import pyarrow as pa
+    except ImportError as e:  # pragma: no cover - optional dependency
+        raise ImportError("pyarrow is required for Arrow record batches / Parquet output") from e
+    return pa.RecordBatch.from_pandas(df, preserve_index=False)
+
+
+def iter_building_performance(
+    n: int = 200, chunk_size: int = 100_000, random_state: int = 42, arrow: bool = False
+) -> Iterator[Union[pd.DataFrame, pa.RecordBatch]]:
+    """Yield simulate_building_performance(n, random_state) in batches of `chunk_size` rows.
+
+    Concatenating the batches is bit-identical to the single-shot frame
+    (including its RangeIndex). With `arrow=True` batches are pyarrow
+    RecordBatches instead of DataFrames.
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    streams = _column_streams(_BUILDING_DRAWS, n, random_state, chunk_size)
+    for start in range(0, n, chunk_size):
+        size = min(chunk_size, n - start)
+        d = {name: draw(rng, size) for (name, draw), rng in zip(_BUILDING_DRAWS, streams)}
+        df = _building_frame(d, index=pd.RangeIndex(start, start + size))
+        yield _to_arrow(df) if arrow else df
+
+
+DATASET_STEMS = {
+    "building": "building_performance_fake",
+    "pilot": "pilot_observations_fake",
+    "survey": "survey_responses_fake",
+}
+
+# Storage dtypes for the columnar formats: low-cardinality strings become
+# categoricals with fixed categories (so every batch shares one dictionary)
+# and measurements are downcast to 32-bit.
+COLUMNAR_DTYPES: Dict[str, Dict[str, object]] = {
+    "building": {
+        "orientation": pd.CategoricalDtype(["N", "E", "S", "W"]),
+        "climate_zone": pd.CategoricalDtype(["subtropical", "temperate"]),
+        **{col: "float32" for col in [
+            "wwr", "shading_depth_m", "glazing_u_w_m2k", "daylit_area", "glare_probability", "cooling_kwh_m2",
+            "heating_kwh_m2", "eui_kwh_m2", "occupancy_density_p_per_100m2", "satisfaction_0_5", "noise_db",
+        ]},
+    },
+    "pilot": {
+        "condition": pd.CategoricalDtype(["A", "B"]),
+        "occupancy_count": "int32",
+        **{col: "float32" for col in ["dwell_time_mean_min", "dwell_time_std_min", "temp_c", "humidity_pct"]},
+    },
+    "survey": {},
+}
+COLUMNAR_FORMATS = {"parquet", "feather"}
+
+
+def compact_dtypes(df: pd.DataFrame, kind: str) -> pd.DataFrame:
+    """Cast a simulated frame to its storage dtypes (see COLUMNAR_DTYPES)."""
+    dtypes = {col: dtype for col, dtype in COLUMNAR_DTYPES[kind].items() if col in df.columns}
+    return df.astype(dtypes)
+
+
+def write_batches(batches: Iterable, path: str | Path, fmt: Optional[str] = None, kind: Optional[str] = None) -> Path:
+    """Stream DataFrame/RecordBatch batches to a CSV, Parquet or Feather file.
+
+    The format is taken from `fmt` or the file suffix (.csv / .parquet / .feather).
+    CSV output matches `DataFrame.to_csv(index=False)` of the concatenated data.
+    For the columnar formats, `kind` ('building', 'pilot' or 'survey') casts
+    DataFrame batches to compact storage dtypes first. Feather files are written
+    uncompressed so that load_dataset can memory-map them.
+    """
+    path = Path(path)
+    fmt = (fmt or path.suffix.lstrip(".")).lower()
+    if fmt not in {"csv"} | COLUMNAR_FORMATS:
+        raise ValueError(f"Unsupported output format: {fmt!r} (use 'csv', 'parquet' or 'feather')")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if fmt == "csv":
+        with open(path, "w", newline="") as f:
+            for i, batch in enumerate(batches):
+                if not isinstance(batch, pd.DataFrame):
+                    batch = batch.to_pandas()
+                batch.to_csv(f, header=(i == 0), index=False)
+        return path
+
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    writer = None
+    try:
+        for batch in batches:
+            if isinstance(batch, pd.DataFrame):
+                batch = _to_arrow(compact_dtypes(batch, kind) if kind else batch)
+            if writer is None:
+                if fmt == "parquet":
+                    writer = pq.ParquetWriter(path, batch.schema)
+                else:
+                    writer = pa.ipc.new_file(path, batch.schema, options=pa.ipc.IpcWriteOptions(compression=None))
+            writer.write_batch(batch)
+    finally:
+        if writer is not None:
+            writer.close()
+    return path
+
+
+def write_building_performance(
+    path: str | Path, n: int, chunk_size: int = 100_000, random_state: int = 42, fmt: Optional[str] = None
+) -> Path:
+    return write_batches(iter_building_performance(n, chunk_size, random_state), path, fmt)
+
+
+def _linspace_at(stop: float, num: int, idx: np.ndarray) -> np.ndarray:
+    """np.linspace(0, stop, num)[idx] without materialising the full array."""
+    if num == 1:
+        return np.zeros(idx.size)
+    y = idx * (stop / (num - 1))
+    y[idx == num - 1] = stop
+    return y
+
+
+def _pilot_block(rng: np.random.Generator, n: int, start: int = 0, size: Optional[int] = None) -> pd.DataFrame:
+    # Rows [start, start + size) of an n-row pilot series; trends depend on
+    # the global row position so independently generated blocks line up.
+    size = n - start if size is None else size
+    i = np.arange(start, start + size)
+    t = pd.date_range(pd.Timestamp("2025-03-01 09:00") + start * pd.Timedelta("10min"), periods=size, freq="10min")
+    cond = np.where(i % 2 == 0, "A", "B")
+    base_occ = 20 + 8 * np.sin(_linspace_at(3.5 * np.pi, n, i))
+    occupancy = np.clip(base_occ + (cond == "B") * 3 + rng.normal(0, 2.5, size), 0, None).astype(int)
+    dwell_mean = np.clip(6 + (cond == "B") * 1.2 + rng.normal(0, 1.0, size), 1, None)
+    dwell_std = np.clip(1.2 + rng.normal(0, 0.3, size), 0.2, None)
+    temp_c = 23 + 2 * np.sin(_linspace_at(2 * np.pi, n, i)) + rng.normal(0, 0.5, size)
+    humidity = np.clip(55 + 5 * np.cos(_linspace_at(2.2 * np.pi, n, i)) + rng.normal(0, 2, size), 35, 85)
     return pd.DataFrame(
         {
             "timestamp": t,
@@ -75,27 +245,122 @@ def simulate_pilot_observations(n: int = 120, random_state: int = 7) -> pd.DataF
             "dwell_time_std_min": dwell_std,
             "temp_c": temp_c,
             "humidity_pct": humidity,
-        }
+        },
+        index=pd.RangeIndex(start, start + size),
     )
 
 
-def simulate_survey_responses(n: int = 60, random_state: int = 123) -> pd.DataFrame:
+def simulate_pilot_observations(n: int = 120, random_state: int = 7) -> pd.DataFrame:
     rng = np.random.default_rng(random_state)
-    positives = [
-        "daylight", "shade", "views", "quiet", "breeze", "green", "spacious", "seating", "cool", "comfortable",
-        "wayfinding", "friendly", "vibrant", "natural light", "privacy", "cozy", "accessible", "clean", "lively",
-    ]
-    negatives = [
-        "glare", "heat", "noise", "crowded", "confusing", "dark", "stuffy", "windy", "hot", "cold",
-        "expensive", "difficult", "slippery", "dirty", "unsafe",
-    ]
-    templates = [
-        "I love the {pos} and {pos2}",
-        "Too much {neg} near the {pos}",
-        "More {pos} would help reduce {neg}",
-        "The space feels {pos} but sometimes {neg}",
-        "Great {pos} and {pos2}, but {neg} at noon",
-    ]
+    return _pilot_block(rng, n)
+
+
+PILOT_STREAM_FIELDS = ("occupancy_count", "dwell_time_mean_min", "temp_c", "humidity_pct")
+
+
+def _pilot_stream_blocks(random_state: int, period: int, block_size: int) -> Iterator[pd.DataFrame]:
+    # Each period is drawn exactly as simulate_pilot_observations(period) would
+    # draw it, from one continuing generator, so the trends repeat every
+    # `period` rows and the first period equals simulate_pilot_observations(
+    # period, random_state). Whole periods are grouped into blocks of about
+    # `block_size` rows; timestamps keep advancing in 10-minute steps.
+    rng = np.random.default_rng(random_state)
+    periods_per_block = max(1, block_size // period)
+    start = 0
+    while True:
+        block = pd.concat([_pilot_block(rng, period) for _ in range(periods_per_block)], ignore_index=True)
+        size = len(block)
+        block.index = pd.RangeIndex(start, start + size)
+        block["timestamp"] = pd.date_range(
+            pd.Timestamp("2025-03-01 09:00") + start * pd.Timedelta("10min"), periods=size, freq="10min"
+        )
+        yield block
+        start += size
+
+
+def iter_pilot_stream(
+    random_state: int = 7,
+    rate: Optional[float] = None,
+    period: int = 120,
+    block_size: int = 1024,
+    batch_size: Optional[int] = None,
+    limit: Optional[int] = None,
+) -> Iterator[Union[Dict, pd.DataFrame]]:
+    """Endless feed of pilot observations, one dict per row (or DataFrames of `batch_size` rows).
+
+    Rows are drawn one `period` at a time (grouped into blocks of about
+    `block_size` rows); the values depend on (random_state, period) only, not
+    on `block_size`, `batch_size` or `rate`, and the first `period` rows equal
+    simulate_pilot_observations(period, random_state). `rate` caps emission
+    at that many rows per second of wall-clock time (None: as fast as the
+    consumer reads). `limit` stops after that many rows, for tests.
+    """
+    clock = time.monotonic
+    t0, emitted = clock(), 0
+    carry: Optional[pd.DataFrame] = None
+    for block in _pilot_stream_blocks(random_state, period, block_size):
+        if batch_size:
+            # Batches may straddle generation blocks; the remainder carries over
+            if carry is not None:
+                block = pd.concat([carry, block])
+            cut = len(block) - len(block) % batch_size
+            carry = block.iloc[cut:]
+            items = [block.iloc[i:i + batch_size] for i in range(0, cut, batch_size)]
+        else:
+            items = block.to_dict("records")
+        for item in items:
+            if limit is not None and emitted >= limit:
+                return
+            if batch_size and limit is not None:
+                item = item.iloc[:limit - emitted]
+            emitted += len(item) if batch_size else 1
+            if rate:
+                delay = t0 + emitted / rate - clock()
+                if delay > 0:
+                    time.sleep(delay)
+            yield item
+
+
+async def aiter_pilot_stream(
+    random_state: int = 7,
+    rate: Optional[float] = None,
+    period: int = 120,
+    block_size: int = 1024,
+    batch_size: Optional[int] = None,
+    limit: Optional[int] = None,
+) -> AsyncIterator[Union[Dict, pd.DataFrame]]:
+    """asyncio counterpart of iter_pilot_stream; pacing uses asyncio.sleep so other tasks keep running."""
+    loop = asyncio.get_running_loop()
+    t0, emitted = loop.time(), 0
+    for item in iter_pilot_stream(random_state, None, period, block_size, batch_size, limit):
+        emitted += len(item) if batch_size else 1
+        delay = t0 + emitted / rate - loop.time() if rate else 0
+        # Always yield to the event loop, so an unthrottled stream cannot starve other tasks
+        await asyncio.sleep(max(delay, 0))
+        yield item
+
+
+_SURVEY_POSITIVES = [
+    "daylight", "shade", "views", "quiet", "breeze", "green", "spacious", "seating", "cool", "comfortable",
+    "wayfinding", "friendly", "vibrant", "natural light", "privacy", "cozy", "accessible", "clean", "lively",
+]
+_SURVEY_NEGATIVES = [
+    "glare", "heat", "noise", "crowded", "confusing", "dark", "stuffy", "windy", "hot", "cold",
+    "expensive", "difficult", "slippery", "dirty", "unsafe",
+]
+_SURVEY_TEMPLATES = [
+    "I love the {pos} and {pos2}",
+    "Too much {neg} near the {pos}",
+    "More {pos} would help reduce {neg}",
+    "The space feels {pos} but sometimes {neg}",
+    "Great {pos} and {pos2}, but {neg} at noon",
+]
+_SURVEY_VERBS = ["Love", "Hate", "Prefer", "Avoid"]
+
+
+def _survey_responses_loop(n: int, rng: np.random.Generator) -> List[str]:
+    # Original per-row implementation; kept for seed-compatible output.
+    positives, negatives, templates = _SURVEY_POSITIVES, _SURVEY_NEGATIVES, _SURVEY_TEMPLATES
     rows = []
     for _ in range(n):
         if rng.random() < 0.6:
@@ -103,18 +368,199 @@ def simulate_survey_responses(n: int = 60, random_state: int = 123) -> pd.DataFr
                 pos=rng.choice(positives), pos2=rng.choice(positives), neg=rng.choice(negatives)
             )
         else:
-            txt = f"{rng.choice(['Love','Hate','Prefer','Avoid'])} the {rng.choice(positives+negatives)} here"
+            txt = f"{rng.choice(_SURVEY_VERBS)} the {rng.choice(positives+negatives)} here"
         rows.append(txt)
+    return rows
+
+
+def _survey_responses_vectorized(n: int, rng: np.random.Generator) -> np.ndarray:
+    # All indices are drawn as whole arrays up front; strings are then built
+    # with element-wise concatenation over object arrays, one template at a time.
+    templated = rng.random(n) < 0.6
+    template_idx = rng.integers(0, len(_SURVEY_TEMPLATES), n)
+    fields = {
+        "pos": np.array(_SURVEY_POSITIVES, dtype=object)[rng.integers(0, len(_SURVEY_POSITIVES), n)],
+        "pos2": np.array(_SURVEY_POSITIVES, dtype=object)[rng.integers(0, len(_SURVEY_POSITIVES), n)],
+        "neg": np.array(_SURVEY_NEGATIVES, dtype=object)[rng.integers(0, len(_SURVEY_NEGATIVES), n)],
+    }
+    verbs = np.array(_SURVEY_VERBS, dtype=object)[rng.integers(0, len(_SURVEY_VERBS), n)]
+    words = np.array(_SURVEY_POSITIVES + _SURVEY_NEGATIVES, dtype=object)[
+        rng.integers(0, len(_SURVEY_POSITIVES) + len(_SURVEY_NEGATIVES), n)
+    ]
+
+    out = verbs + " the " + words + " here"
+    for t, template in enumerate(_SURVEY_TEMPLATES):
+        rows = np.flatnonzero(templated & (template_idx == t))
+        if rows.size == 0:
+            continue
+        filled = np.full(rows.size, "", dtype=object)
+        for literal, field, _, _ in string.Formatter().parse(template):
+            if literal:
+                filled = filled + literal
+            if field is not None:
+                filled = filled + fields[field][rows]
+        out[rows] = filled
+    return out
+
+
+def simulate_survey_responses(n: int = 60, random_state: int = 123, seed_compatible: bool = True) -> pd.DataFrame:
+    """Short free-text survey responses.
+
+    By default the original per-row loop runs, so a given seed reproduces the
+    responses (and the numbers in the notebooks) generated before
+    vectorisation. `seed_compatible=False` makes all random draws as arrays
+    and assembles strings in bulk -- much faster for large n, but a different
+    sequence for the same seed.
+    """
+    rng = np.random.default_rng(random_state)
+    if seed_compatible:
+        rows = _survey_responses_loop(n, rng)
+    else:
+        rows = _survey_responses_vectorized(n, rng)
     return pd.DataFrame({"response_text": rows})
 
 
-def save_default_fake_data(base_dir: str | Path = ".") -> Tuple[Path, Path, Path]:
+SIMULATORS = {
+    "building": simulate_building_performance,
+    "pilot": simulate_pilot_observations,
+    "survey": simulate_survey_responses,
+}
+DEFAULT_SEEDS = {"building": 42, "pilot": 7, "survey": 123}
+
+
+def _simulate_block(kind: str, n: int, start: int, size: int, seed: np.random.SeedSequence) -> pd.DataFrame:
+    if kind == "pilot":
+        return _pilot_block(np.random.default_rng(seed), n, start, size)
+    # Parallel blocks are a separate stream anyway, so survey blocks use the fast path
+    kwargs = {"seed_compatible": False} if kind == "survey" else {}
+    df = SIMULATORS[kind](size, random_state=seed, **kwargs)
+    df.index = pd.RangeIndex(start, start + size)
+    return df
+
+
+def iter_parallel(
+    kind: str,
+    n: int,
+    random_state: int = 42,
+    block_size: int = 100_000,
+    workers: Optional[int] = None,
+) -> Iterator[pd.DataFrame]:
+    """Generate `n` rows of a simulated dataset across a process pool, in order.
+
+    Rows are split into blocks of `block_size`; block i draws from the i-th
+    child of SeedSequence(random_state).spawn(...). The output depends only on
+    (random_state, n, block_size) -- never on `workers` -- but it is a
+    different stream from the single-process simulate_* functions.
+    At most 2 * workers blocks are in flight, so memory stays bounded while
+    a slow consumer (e.g. a disk writer) drains the results.
+    """
+    yield from _run_blocks(_simulate_block, _parallel_tasks(kind, n, random_state, block_size), workers)
+
+
+def _parallel_tasks(kind: str, n: int, random_state: int, block_size: int) -> List[tuple]:
+    if kind not in SIMULATORS:
+        raise ValueError(f"Unknown dataset {kind!r}; expected one of {sorted(SIMULATORS)}")
+    if block_size <= 0:
+        raise ValueError("block_size must be positive")
+    starts = range(0, n, block_size)
+    seeds = np.random.SeedSequence(random_state).spawn(len(starts))
+    return [(kind, n, start, min(block_size, n - start), seed) for start, seed in zip(starts, seeds)]
+
+
+def _run_blocks(fn, tasks: List[tuple], workers: Optional[int]) -> Iterator:
+    # Results in task order, with at most 2 * workers tasks in flight
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        for task in tasks:
+            yield fn(*task)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending: Deque = deque()
+        for task in tasks:
+            pending.append(pool.submit(fn, *task))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _write_csv_shard(kind: str, n: int, start: int, size: int, seed: np.random.SeedSequence, shard: Path) -> Path:
+    _simulate_block(kind, n, start, size, seed).to_csv(shard, header=(start == 0), index=False)
+    return shard
+
+
+def write_csv_parallel(
+    kind: str,
+    n: int,
+    path: str | Path,
+    random_state: int = 42,
+    block_size: int = 100_000,
+    workers: Optional[int] = None,
+) -> Path:
+    """Write iter_parallel's rows to one CSV, formatting and writing blocks in the workers.
+
+    Each worker generates its block and writes it to its own shard file; the
+    main process only appends finished shards to `path` in order (a raw byte
+    copy) and deletes them, so at most 2 * workers shards exist at a time.
+    The file is identical to write_batches(iter_parallel(...), path).
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    shard_dir = Path(tempfile.mkdtemp(dir=path.parent, prefix=path.name + "."))
+    tmp = shard_dir / "combined.csv"
+    try:
+        tasks = [task + (shard_dir / f"part-{i:06d}.csv",)
+                 for i, task in enumerate(_parallel_tasks(kind, n, random_state, block_size))]
+        with open(tmp, "wb") as out:
+            for shard in _run_blocks(_write_csv_shard, tasks, workers):
+                with open(shard, "rb") as f:
+                    shutil.copyfileobj(f, out, 1 << 20)
+                shard.unlink()
+        os.replace(tmp, path)
+    finally:
+        shutil.rmtree(shard_dir, ignore_errors=True)
+    return path
+
+
+def simulate_parallel(kind: str, n: int, random_state: int = 42, block_size: int = 100_000,
+                      workers: Optional[int] = None) -> pd.DataFrame:
+    return pd.concat(iter_parallel(kind, n, random_state, block_size, workers))
+
+
+def save_parallel_fake_data(
+    base_dir: str | Path = ".",
+    n_building: int = 1_000_000,
+    n_pilot: int = 1_000_000,
+    n_survey: int = 1_000_000,
+    block_size: int = 100_000,
+    workers: Optional[int] = None,
+    fmt: str = "csv",
+) -> Tuple[Path, Path, Path]:
+    """Large-scale counterpart of save_default_fake_data: blocks are generated
+    in parallel and streamed to disk as they complete. For CSV the workers
+    also format and write their blocks (see write_csv_parallel)."""
+    data_dir = Path(base_dir) / "data"
+    paths = []
+    for kind, n in [("building", n_building), ("pilot", n_pilot), ("survey", n_survey)]:
+        seed = DEFAULT_SEEDS[kind]
+        path = data_dir / f"{DATASET_STEMS[kind]}.{fmt}"
+        if fmt == "csv":
+            paths.append(write_csv_parallel(kind, n, path, seed, block_size, workers))
+        else:
+            paths.append(write_batches(iter_parallel(kind, n, seed, block_size, workers), path, fmt, kind))
+    return tuple(paths)
+
+
+def save_default_fake_data(base_dir: str | Path = ".", fmt: str = "csv") -> Tuple[Path, Path, Path]:
     base = Path(base_dir)
     data_dir = base / "data"
     data_dir.mkdir(parents=True, exist_ok=True)
     b = simulate_building_performance()
     p = simulate_pilot_observations()
     s = simulate_survey_responses()
+    if fmt != "csv":
+        return tuple(write_batches([df], data_dir / f"{DATASET_STEMS[kind]}.{fmt}", fmt, kind)
+                     for kind, df in [("building", b), ("pilot", p), ("survey", s)])
     bf = data_dir / "building_performance_fake.csv"
     pf = data_dir / "pilot_observations_fake.csv"
     sf = data_dir / "survey_responses_fake.csv"
@@ -124,7 +570,83 @@ def save_default_fake_data(base_dir: str | Path = ".") -> Tuple[Path, Path, Path
     return bf, pf, sf
 
 
+def dataset_path(kind: str, base_dir: str | Path = ".", fmt: Optional[str] = None) -> Path:
+    """Path of a saved dataset; without `fmt`, the most recently written of the
+    feather, parquet and csv copies (ties prefer feather, then parquet), so a
+    regenerated CSV is never shadowed by a stale columnar file."""
+    if kind not in DATASET_STEMS:
+        raise ValueError(f"Unknown dataset {kind!r}; expected one of {sorted(DATASET_STEMS)}")
+    data_dir = Path(base_dir) / "data"
+    if fmt:
+        return data_dir / f"{DATASET_STEMS[kind]}.{fmt}"
+    candidates = []
+    for rank, ext in enumerate(["feather", "parquet", "csv"]):
+        path = data_dir / f"{DATASET_STEMS[kind]}.{ext}"
+        try:
+            candidates.append((path.stat().st_mtime_ns, -rank, path))
+        except OSError:
+            continue
+    if not candidates:
+        raise FileNotFoundError(f"No saved {kind!r} dataset under {data_dir}")
+    return max(candidates)[2]
+
+
+def load_dataset(
+    kind: str, base_dir: str | Path = ".", columns: Optional[List[str]] = None, fmt: Optional[str] = None
+) -> pd.DataFrame:
+    """Load a saved dataset, reading only `columns` if given.
+
+    Feather and Parquet files are memory-mapped and only the requested
+    columns are decoded; categoricals and downcast dtypes round-trip. CSV
+    files are parsed with the same storage dtypes applied.
+    """
+    path = dataset_path(kind, base_dir, fmt)
+    suffix = path.suffix.lstrip(".").lower()
+    if suffix == "feather":
+        import pyarrow.feather as feather
+
+        return feather.read_table(path, columns=columns, memory_map=True).to_pandas(split_blocks=True)
+    if suffix == "parquet":
+        import pyarrow.parquet as pq
+
+        return pq.read_table(path, columns=columns, memory_map=True).to_pandas(split_blocks=True)
+    # Categories are inferred rather than fixed here: hand-edited CSVs may hold other labels
+    dtypes = {c: "category" if isinstance(t, pd.CategoricalDtype) else t
+              for c, t in COLUMNAR_DTYPES[kind].items() if columns is None or c in columns}
+    df = pd.read_csv(path, usecols=columns, dtype=dtypes)
+    if "timestamp" in df.columns:
+        df["timestamp"] = pd.to_datetime(df["timestamp"])
+    return df
+
+
 if __name__ == "__main__":
-    paths = save_default_fake_data(Path(__file__).resolve().parents[1])
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Write the default fake datasets to data/")
+    parser.add_argument("--format", choices=["csv", "parquet", "feather"], default="csv")
+    parser.add_argument("--stream", action="store_true",
+                        help="instead of writing files, stream pilot rows and print rolling per-condition stats")
+    parser.add_argument("--rate", type=float, default=None, help="rows per second in --stream mode (default: unthrottled)")
+    parser.add_argument("--seconds", type=float, default=10.0, help="how long to stream")
+    parser.add_argument("--window", type=int, default=1000, help="rolling window in samples per condition")
+    args = parser.parse_args()
+    if args.stream:
+        from streaming_stats import RollingStats
+
+        stats = RollingStats(PILOT_STREAM_FIELDS, window=args.window)
+        t0 = last = time.monotonic()
+        n = 0
+        for row in iter_pilot_stream(rate=args.rate):
+            stats.update(row["condition"], row)
+            n += 1
+            now = time.monotonic()
+            if now - last >= 1.0 or now - t0 >= args.seconds:
+                last = now
+                print(f"{n:,} rows, {n / (now - t0):,.0f} rows/s")
+                print(stats.summary().round(2).to_string(), flush=True)
+                if now - t0 >= args.seconds:
+                    break
+        raise SystemExit(0)
+    paths = save_default_fake_data(Path(__file__).resolve().parents[1], fmt=args.format)
     print("Saved datasets:", paths)
 
@@ -1,68 +1,98 @@
 #!/usr/bin/env python3
+import argparse
+import hashlib
 import os
 import re
-import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from importlib import metadata
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
+
+from bounded_extract import Budget, extract_bounded
+from pipeline_trace import Trace, annotate, profiled
+from rubric_matcher import RubricAutomaton
+from similarity_index import DEFAULT_INDEX, MinHashIndex, submission_id
+from text_cache import DEFAULT_CACHE, tool_version
 
 ROOT = Path(__file__).resolve().parent.parent
 A3_DIR = ROOT / 'A3'
 OUT_QMD = A3_DIR / 'A3-assessments.auto.qmd'
 
-def read_text_from_pdf(path: Path) -> str:
+# Bump when the extraction logic below changes so stale cache entries are ignored
+EXTRACTOR_VERSION = '2'
+
+# Default per-file extraction limits; pass a Budget to override them
+DEFAULT_BUDGET = Budget()
+
+def _package_version(name: str) -> str:
     try:
-        res = subprocess.run(['pdftotext', '-layout', '-nopgbrk', '-enc', 'UTF-8', str(path), '-'],
-                             check=True, capture_output=True)
-        return res.stdout.decode('utf-8', errors='ignore')
-    except Exception:
-        return ''
+        return metadata.version(name)
+    except metadata.PackageNotFoundError:
+        return 'unknown'
 
-def read_text_from_docx(path: Path) -> str:
+def _chain_version(suffix: str) -> str:
+    tools = {
+        '.pdf': [tool_version('pdftotext', '-v'), _package_version('PyPDF2')],
+        '.docx': [tool_version('pandoc', '--version')],
+        '.pptx': [],
+    }[suffix]
+    return '/'.join([EXTRACTOR_VERSION, *tools])
+
+def read_text_bounded(path: Path, budget: Optional[Budget] = None) -> str:
+    """Cached text of a PDF/DOCX/PPTX from the bounded fallback chain ('' if every extractor fails)."""
+    return read_text_bounded_checked(path, budget)[0]
+
+def read_text_bounded_checked(path: Path, budget: Optional[Budget] = None) -> Tuple[str, bool]:
+    """(text, complete) for a PDF/DOCX/PPTX; complete is False when the text may be partial or missing.
+
+    Complete extractions are cached, and so is '' when every extractor ran
+    and found no text (e.g. scanned PDFs), so such files are not re-tried on
+    every run. A file that fell back to its first pages, timed out or failed
+    is retried next time. The winning extractor, its
+    latency and the attempt log are attached to the current trace stage.
+    """
+    suffix = path.suffix.lower()
     try:
-        res = subprocess.run(['pandoc', str(path), '-t', 'markdown'], check=True, capture_output=True)
-        return res.stdout.decode('utf-8', errors='ignore')
-    except Exception:
-        return ''
+        key = DEFAULT_CACHE.key(path, f'chain{suffix}', _chain_version(suffix))
+    except OSError as e:
+        annotate(error=f'{type(e).__name__}: {e}')
+        return '', False
+    text = DEFAULT_CACHE.get(key)
+    if text is not None:
+        annotate(extractor='cache')
+        return text, True
+    result = extract_bounded(path, budget or DEFAULT_BUDGET)
+    exit_codes = [a.exit_code for a in result.attempts if a.exit_code is not None]
+    annotate(extractor=result.extractor, extract_s=round(result.seconds, 3), attempts=result.describe(),
+             complete=result.complete, exit_code=exit_codes[0] if exit_codes else None)
+    if result.extractor is None and not result.no_text:
+        annotate(error=result.attempts[-1].error if result.attempts else 'budget exhausted')
+    complete = result.complete or result.no_text
+    if complete:
+        DEFAULT_CACHE.put(key, result.text)
+    return result.text, complete
+
+def read_text_from_pdf(path: Path, budget: Optional[Budget] = None) -> str:
+    return read_text_bounded(path, budget)
+
+def read_text_from_docx(path: Path, budget: Optional[Budget] = None) -> str:
+    return read_text_bounded(path, budget)
 
 def read_text_from_txt(path: Path) -> str:
     try:
         return path.read_text(encoding='utf-8', errors='ignore')
-    except Exception:
+    except Exception as e:
+        annotate(error=f'{type(e).__name__}: {e}')
         return ''
 
-def read_text_from_pptx(path: Path) -> str:
-    # Extract text using the same approach as pptx_to_rtf
-    import zipfile
-    import xml.etree.ElementTree as ET
-    texts = []
-    try:
-        with zipfile.ZipFile(path, 'r') as z:
-            slide_paths = sorted([p for p in z.namelist() if p.startswith('ppt/slides/slide') and p.endswith('.xml')],
-                                 key=lambda p: int(Path(p).stem.replace('slide','')))
-            for sp in slide_paths:
-                with z.open(sp) as f:
-                    try:
-                        tree = ET.parse(f)
-                    except ET.ParseError:
-                        continue
-                root = tree.getroot()
-                paras = []
-                for p in root.findall('.//{*}p'):
-                    runs = []
-                    for t in p.findall('.//{*}t'):
-                        if t.text:
-                            runs.append(t.text)
-                    para = ''.join(runs).strip()
-                    if para:
-                        paras.append(para)
-                if paras:
-                    texts.append('\n'.join(paras))
-    except Exception:
-        return ''
-    return '\n\n'.join(texts)
+def read_text_from_pptx(path: Path, budget: Optional[Budget] = None) -> str:
+    return read_text_bounded(path, budget)
 
 def detect_name_from_filename(filename: str) -> str:
-    base = os.path.splitext(filename)[0]
+    return detect_name_from_stem(os.path.splitext(filename)[0])
+
+def detect_name_from_stem(base: str) -> str:
     parts = base.split(' - ')
     if len(parts) >= 3:
         return parts[1].strip()
@@ -70,28 +100,45 @@ def detect_name_from_filename(filename: str) -> str:
         return base[3:].strip()
     return base
 
+# Rubric keyword lists
+RDQ = [
+    'research question','hypothesis','hypotheses','success criteria','decision threshold',
+    'alternative explanation','method','methodology','quality control','reliability','validity'
+]
+PILOT = [
+    'pilot','implementation','what worked','what didn',"didn't work",'unexpected','refine','refinement','revised','timeline','resources','risk','backup'
+]
+DOC = [
+    'protocol','step-by-step','reproducibility','data management','metadata','ethical','privacy','consent','irb','access','security'
+]
+COMM = [
+    'figure','table','diagram','appendix','section','heading','visual','overview'
+]
+APPROACH_TOKENS = {
+    'simulation': ['simulation','simulate','radiance','energyplus','cfd','ladybug','honeybee'],
+    'user study': ['user study','survey','interview','focus group','questionnaire'],
+    'measurement': ['measurement','sensor','monitoring','environmental','observation'],
+    'comparative': ['comparative','compare','alternative','alternatives'],
+    'case study': ['case study','case-study']
+}
+
+# Points out of 100 for full coverage of each rubric category
+SCORE_WEIGHTS = {'rdq': 40, 'pilot': 30, 'doc': 20, 'comm': 10}
+
+# Compiled once per run; finds every rubric and approach token in one pass
+RUBRIC = RubricAutomaton(RDQ + PILOT + DOC + COMM + [t for toks in APPROACH_TOKENS.values() for t in toks])
+
+# Cache key component for analysed/rendered sections: changes with the rubric
+# data automatically; bump the prefix when the scoring or wording code changes
+RUBRIC_VERSION = '1/' + hashlib.sha256(
+    repr((RDQ, PILOT, DOC, COMM, sorted(APPROACH_TOKENS.items()))).encode('utf-8')).hexdigest()[:12]
+
 def analyze_text(text: str) -> Dict:
     low = text.lower()
-    # token sets
-    RDQ = [
-        'research question','hypothesis','hypotheses','success criteria','decision threshold',
-        'alternative explanation','method','methodology','quality control','reliability','validity'
-    ]
-    PILOT = [
-        'pilot','implementation','what worked','what didn',"didn't work",'unexpected','refine','refinement','revised','timeline','resources','risk','backup'
-    ]
-    DOC = [
-        'protocol','step-by-step','reproducibility','data management','metadata','ethical','privacy','consent','irb','access','security'
-    ]
-    COMM = [
-        'figure','table','diagram','appendix','section','heading','visual','overview'
-    ]
+    # token -> start offsets in the lower-cased text
+    matches = RUBRIC.scan(low)
     def match(tokens):
-        present = set()
-        for t in tokens:
-            if t in low:
-                present.add(t)
-        return present
+        return {t for t in tokens if t in matches}
     m_rdq = match(RDQ)
     m_pil = match(PILOT)
     m_doc = match(DOC)
@@ -103,16 +150,9 @@ def analyze_text(text: str) -> Dict:
         m_com.add('heading')
 
     # approach detection
-    approach_tokens = {
-        'simulation': ['simulation','simulate','radiance','energyplus','cfd','ladybug','honeybee'],
-        'user study': ['user study','survey','interview','focus group','questionnaire'],
-        'measurement': ['measurement','sensor','monitoring','environmental','observation'],
-        'comparative': ['comparative','compare','alternative','alternatives'],
-        'case study': ['case study','case-study']
-    }
     approaches_present = []
-    for name, toks in approach_tokens.items():
-        if any(t in low for t in toks):
+    for name, toks in APPROACH_TOKENS.items():
+        if any(t in matches for t in toks):
             approaches_present.append(name)
 
     # counts and scores
@@ -130,7 +170,8 @@ def analyze_text(text: str) -> Dict:
     elif word_count < 800:
         length_factor = 0.9
 
-    est = (s_rdq*40 + s_pil*30 + s_doc*20 + s_com*10) * length_factor
+    w = SCORE_WEIGHTS
+    est = (s_rdq*w['rdq'] + s_pil*w['pilot'] + s_doc*w['doc'] + s_com*w['comm']) * length_factor
     est = round(est)
 
     return {
@@ -138,7 +179,9 @@ def analyze_text(text: str) -> Dict:
         'present': {'rdq': m_rdq, 'pilot': m_pil, 'doc': m_doc, 'comm': m_com},
         'approaches': approaches_present,
         'word_count': word_count,
-        'estimated_grade': est
+        'estimated_grade': est,
+        'matches': matches,
+        'match_counts': {t: len(pos) for t, pos in matches.items()}
     }
 
 def strength_statements(data: Dict) -> List[str]:
@@ -243,53 +286,7 @@ def unique_closing(idx: int) -> str:
     ]
     return closers[idx % len(closers)]
 
-def main():
-    files = sorted([p for p in A3_DIR.iterdir() if p.is_file() and p.suffix.lower() in {'.pdf','.docx','.pptx','.txt'}])
-    sections = []
-    for idx, f in enumerate(files, start=1):
-        name = detect_name_from_filename(f.name)
-        # get text
-        if f.suffix.lower() == '.pdf':
-            text = read_text_from_pdf(f)
-        elif f.suffix.lower() == '.docx':
-            text = read_text_from_docx(f)
-        elif f.suffix.lower() == '.pptx':
-            text = read_text_from_pptx(f)
-        else:
-            text = read_text_from_txt(f)
-        analysis = analyze_text(text)
-        strengths = strength_statements(analysis)
-        improvements = improvement_statements(analysis)
-        critique = core_critique(analysis)
-        grade = analysis['estimated_grade']
-
-        # Build section
-        anchor = re.sub(r'[^a-z0-9]+','-', name.lower()).strip('-')
-        sec = []
-        sec.append(f"## {idx}. {name} {{#{anchor}}}")
-        sec.append('\n### Opening Recognition')
-        sec.append(nice_opening(name))
-        sec.append('\n### Core Critique')
-        sec.append(critique)
-        sec.append('\n### Strengths (Top 3)')
-        if strengths:
-            for s in strengths:
-                sec.append(f"- {s}")
-        else:
-            sec.append("- Evidence of progress toward a coherent method")
-        sec.append('\n### Areas to Improve (Top 3)')
-        if improvements:
-            for s in improvements:
-                sec.append(f"- {s}")
-        else:
-            sec.append("- Clarify the most critical elements of the method")
-        sec.append('\n### Closing')
-        sec.append(unique_closing(idx-1))
-        sec.append(f"\n**Estimated Grade: {grade}/100**")
-        sec.append('\n---\n')
-        sections.append('\n'.join(sec))
-
-    header = '''---
+HEADER = '''---
 title: "A3 Assessment: Test Plan + Pilot Study"
 subtitle: "Automated first-pass feedback aligned to rubric"
 format:
@@ -307,9 +304,315 @@ This document provides a structured first-pass assessment generated from each su
 
 # Individual Feedback
 '''
-    OUT_QMD.write_text(header + '\n'.join(sections), encoding='utf-8')
+
+SUPPORTED_SUFFIXES = {'.pdf','.docx','.pptx','.txt'}
+
+def list_submissions(a3_dir: Optional[Path] = None) -> List[Path]:
+    a3_dir = a3_dir or A3_DIR
+    return sorted([p for p in a3_dir.iterdir() if p.is_file() and p.suffix.lower() in SUPPORTED_SUFFIXES])
+
+def extract_text(f: Path, budget: Optional[Budget] = None) -> str:
+    if f.suffix.lower() == '.pdf':
+        return read_text_from_pdf(f, budget)
+    elif f.suffix.lower() == '.docx':
+        return read_text_from_docx(f, budget)
+    elif f.suffix.lower() == '.pptx':
+        return read_text_from_pptx(f, budget)
+    return read_text_from_txt(f)
+
+def extract_text_checked(f: Path, budget: Optional[Budget] = None) -> Tuple[str, bool]:
+    """Like extract_text, plus whether the whole document was read (see read_text_bounded_checked)."""
+    if f.suffix.lower() in ('.pdf', '.docx', '.pptx'):
+        return read_text_bounded_checked(f, budget)
+    return read_text_from_txt(f), True
+
+def render_section(idx: int, name: str, analysis: Dict) -> str:
+    strengths = strength_statements(analysis)
+    improvements = improvement_statements(analysis)
+    critique = core_critique(analysis)
+    grade = analysis['estimated_grade']
+
+    anchor = re.sub(r'[^a-z0-9]+','-', name.lower()).strip('-')
+    sec = []
+    sec.append(f"## {idx}. {name} {{#{anchor}}}")
+    sec.append('\n### Opening Recognition')
+    sec.append(nice_opening(name))
+    sec.append('\n### Core Critique')
+    sec.append(critique)
+    sec.append('\n### Strengths (Top 3)')
+    if strengths:
+        for s in strengths:
+            sec.append(f"- {s}")
+    else:
+        sec.append("- Evidence of progress toward a coherent method")
+    sec.append('\n### Areas to Improve (Top 3)')
+    if improvements:
+        for s in improvements:
+            sec.append(f"- {s}")
+    else:
+        sec.append("- Clarify the most critical elements of the method")
+    if 'similar' in analysis:
+        sec.append('\n### Similarity Check')
+        if analysis['similar']:
+            for doc_id, score in analysis['similar'][:3]:
+                cohort, _, stem = doc_id.partition('/')
+                sec.append(f"- {score:.0%} estimated text overlap with {detect_name_from_stem(stem)} ({cohort})")
+        else:
+            sec.append("- No near-duplicate submissions found in this or earlier cohorts")
+    sec.append('\n### Closing')
+    sec.append(unique_closing(idx-1))
+    sec.append(f"\n**Estimated Grade: {grade}/100**")
+    sec.append('\n---\n')
+    return '\n'.join(sec)
+
+def _extract_traced(f: Path, trace: Trace, budget: Optional[Budget] = None) -> str:
+    with trace.stage(f.name, 'extract', suffix=f.suffix.lower()) as rec:
+        text = extract_text(f, budget)
+        rec['bytes'] = len(text.encode('utf-8'))
+    return text
+
+def _assess_one(i: int, f: Path, text: str, trace: Trace) -> str:
+    with trace.stage(f.name, 'analyze'):
+        analysis = analyze_text(text)
+    with trace.stage(f.name, 'render'):
+        return render_section(i + 1, detect_name_from_filename(f.name), analysis)
+
+def _assess_with_similarity(files: List[Path], jobs: int, trace: Trace, budget: Optional[Budget],
+                            index: MinHashIndex, cohort: str, threshold: float) -> List[str]:
+    # Every text must be indexed before any section can list its matches
+    if jobs == 1:
+        texts = [_extract_traced(f, trace, budget) for f in files]
+    else:
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            texts = list(pool.map(lambda f: _extract_traced(f, trace, budget), files))
+    analyses = []
+    for f, text in zip(files, texts):
+        with trace.stage(f.name, 'analyze'):
+            analyses.append(analyze_text(text))
+    doc_ids = [submission_id(cohort, f) for f in files]
+    with trace.stage(f'{len(files)} files', 'similarity'):
+        sigs = [index.add(doc_id, text, cohort) for doc_id, text in zip(doc_ids, texts)]
+        for analysis, doc_id, sig in zip(analyses, doc_ids, sigs):
+            analysis['similar'] = index.query(sig, threshold, exclude=doc_id)
+    sections = []
+    for i, (f, analysis) in enumerate(zip(files, analyses)):
+        with trace.stage(f.name, 'render'):
+            sections.append(render_section(i + 1, detect_name_from_filename(f.name), analysis))
+    return sections
+
+def assess_files(files: List[Path], jobs: Optional[int] = None, trace: Optional[Trace] = None,
+                 budget: Optional[Budget] = None, similarity: Optional[MinHashIndex] = None,
+                 cohort: str = '', similarity_threshold: float = 0.5) -> List[str]:
+    """Extract, analyse and render every file; return sections in input order.
+
+    Extraction runs on a thread pool of `jobs` workers, which also bounds how
+    many pdftotext/pandoc subprocesses run at once. Each result is analysed
+    as soon as it arrives, while the remaining extractions continue. With
+    jobs=1 everything runs on the calling thread (e.g. for profiling).
+    Per-file stage timings are recorded in `trace` if given; `budget` limits
+    each extraction (DEFAULT_BUDGET if None).
+
+    With a `similarity` index, every text is added to it under `cohort`
+    (replacing any earlier entry for the same submission) and each section
+    gets a Similarity Check listing indexed submissions (this cohort or
+    earlier ones) whose estimated overlap is at least the threshold.
+    """
+    trace = trace if trace is not None else Trace()
+    jobs = jobs or os.cpu_count() or 1
+    if similarity is not None:
+        return _assess_with_similarity(files, jobs, trace, budget, similarity, cohort, similarity_threshold)
+    sections: List[Optional[str]] = [None] * len(files)
+    if jobs == 1:
+        for i, f in enumerate(files):
+            sections[i] = _assess_one(i, f, _extract_traced(f, trace, budget), trace)
+        return sections
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        futures = {pool.submit(_extract_traced, f, trace, budget): i for i, f in enumerate(files)}
+        for future in as_completed(futures):
+            i = futures[future]
+            sections[i] = _assess_one(i, files[i], future.result(), trace)
+    return sections
+
+class SectionCache:
+    """Rendered sections for a changing set of submissions.
+
+    Files are re-extracted only when their (size, mtime) changes; analyses
+    are keyed by text hash plus RUBRIC_VERSION and sections additionally by
+    name and position, so adding one submission costs one extraction and one
+    analysis, plus cheap re-rendering of the sections whose number shifted.
+
+    Partial extractions (fallbacks, timeouts, failures) are rendered but not
+    remembered as up to date, so every refresh retries them.
+    """
+
+    def __init__(self, jobs: Optional[int] = None, budget: Optional[Budget] = None):
+        self.jobs = jobs or os.cpu_count() or 1
+        self.budget = budget
+        self._files: Dict[Path, Tuple[Tuple[int, int], str]] = {}
+        self._partial: Dict[Path, str] = {}
+        self._analyses: Dict[str, Dict] = {}
+        self._sections: Dict[Tuple[str, str, int], str] = {}
+
+    def refresh(self, files: List[Path]) -> Dict[str, List[Path]]:
+        """Bring the cache in line with `files`; return the added/changed/removed/retried paths."""
+        changes: Dict[str, List[Path]] = {'added': [], 'changed': [], 'removed': [], 'retried': []}
+        stale = []
+        for f in files:
+            try:
+                st = f.stat()
+            except OSError:
+                continue
+            sig = (st.st_size, st.st_mtime_ns)
+            known = self._files.get(f)
+            if known is not None and known[0] == sig:
+                continue
+            if known is not None:
+                changes['changed'].append(f)
+            elif f in self._partial:
+                changes['retried'].append(f)
+            else:
+                changes['added'].append(f)
+            stale.append((f, sig))
+        present = set(files)
+        changes['removed'] = [f for f in [*self._files, *self._partial] if f not in present]
+        for f in changes['removed']:
+            self._files.pop(f, None)
+            self._partial.pop(f, None)
+
+        with ThreadPoolExecutor(max_workers=self.jobs) as pool:
+            texts = pool.map(lambda item: extract_text_checked(item[0], self.budget), stale)
+            for (f, sig), (text, complete) in zip(stale, texts):
+                key = hashlib.sha256(f'{RUBRIC_VERSION}\0{text}'.encode('utf-8', errors='surrogatepass')).hexdigest()
+                if key not in self._analyses:
+                    self._analyses[key] = analyze_text(text)
+                if complete:
+                    self._files[f] = (sig, key)
+                    self._partial.pop(f, None)
+                else:
+                    self._files.pop(f, None)
+                    self._partial[f] = key
+
+        live = {key for _, key in self._files.values()} | set(self._partial.values())
+        self._analyses = {k: v for k, v in self._analyses.items() if k in live}
+        return changes
+
+    def sections(self, files: List[Path]) -> List[str]:
+        """Sections for `files` (already refreshed), numbered in the given order."""
+        out, keep = [], {}
+        for i, f in enumerate(files):
+            text_key = self._files[f][1] if f in self._files else self._partial.get(f)
+            if text_key is None:
+                continue
+            name = detect_name_from_filename(f.name)
+            key = (text_key, name, len(out) + 1)
+            section = self._sections.get(key)
+            if section is None:
+                section = render_section(len(out) + 1, name, self._analyses[key[0]])
+            keep[key] = section
+            out.append(section)
+        self._sections = keep
+        return out
+
+def write_if_changed(path: Path, text: str) -> bool:
+    """Atomically replace `path` with `text` unless it already holds exactly that."""
+    try:
+        if path.read_text(encoding='utf-8') == text:
+            return False
+    except OSError:
+        pass
+    tmp = path.with_name(path.name + '.tmp')
+    tmp.write_text(text, encoding='utf-8')
+    os.replace(tmp, path)
+    return True
+
+def watch(a3_dir: Optional[Path] = None, out_qmd: Optional[Path] = None, interval: float = 1.0,
+          jobs: Optional[int] = None, once: bool = False, budget: Optional[Budget] = None) -> None:
+    """Poll `a3_dir` every `interval` seconds and re-stitch the QMD when submissions change.
+
+    Uses mtime polling rather than inotify so it behaves the same on macOS,
+    Linux and network drives. Stop with Ctrl-C; `once=True` does a single pass.
+    """
+    a3_dir = a3_dir or A3_DIR
+    out_qmd = out_qmd or OUT_QMD
+    cache = SectionCache(jobs, budget)
+    first = True
+    try:
+        while True:
+            t0 = time.perf_counter()
+            files = list_submissions(a3_dir)
+            changes = cache.refresh(files)
+            if first or any(changes.values()):
+                written = write_if_changed(out_qmd, HEADER + '\n'.join(cache.sections(files)))
+                # Partial files are retried every poll; stay quiet while a retry changes nothing
+                if first or written or any(changes[k] for k in ('added', 'changed', 'removed')):
+                    summary = ', '.join(f'{len(v)} {k}' for k, v in changes.items() if v) or 'no changes'
+                    status = f'wrote {out_qmd.name}' if written else 'output unchanged'
+                    print(f"[{time.strftime('%H:%M:%S')}] {len(files)} submissions, {summary}; "
+                          f"{status} in {time.perf_counter() - t0:.2f}s", flush=True)
+                first = False
+            if once:
+                return
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        print('Stopped watching')
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Generate first-pass A3 assessments')
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help='concurrent extractions (default: CPU count)')
+    parser.add_argument('--trace', type=Path, default=None,
+                        help='write per-file stage timings to this .json or .csv file')
+    parser.add_argument('--profile', type=Path, default=None,
+                        help='write cProfile stats here (main thread only; use -j 1 to include extraction)')
+    parser.add_argument('--budget', type=float, default=DEFAULT_BUDGET.seconds,
+                        help='seconds allowed per file across the whole extractor fallback chain')
+    parser.add_argument('--memory-mb', type=int, default=DEFAULT_BUDGET.memory_mb,
+                        help='address-space cap per extraction attempt (POSIX)')
+    parser.add_argument('--fallback-pages', type=int, default=DEFAULT_BUDGET.fallback_pages,
+                        help='pages read by the last-resort PDF extractor')
+    parser.add_argument('--similarity', action='store_true',
+                        help='check submissions for near-duplicates against this and earlier cohorts')
+    parser.add_argument('--cohort', default=None,
+                        help='cohort label for the similarity index, e.g. 2025 (required with --similarity)')
+    parser.add_argument('--similarity-index', type=Path, default=DEFAULT_INDEX)
+    parser.add_argument('--similarity-threshold', type=float, default=0.5,
+                        help='minimum estimated Jaccard similarity to report')
+    parser.add_argument('--watch', action='store_true',
+                        help='keep running and update the QMD as submissions are added, changed or removed')
+    parser.add_argument('--interval', type=float, default=1.0, help='seconds between polls in --watch mode')
+    args = parser.parse_args(argv)
+    if args.similarity and not args.cohort:
+        parser.error('--similarity requires --cohort, so re-runs update the same index entries')
+    if args.watch:
+        unsupported = [opt for opt, val in (('--similarity', args.similarity), ('--trace', args.trace),
+                                            ('--profile', args.profile)) if val]
+        if unsupported:
+            parser.error(f"--watch cannot be combined with {', '.join(unsupported)}")
+    return args
+
+def main(argv=None):
+    args = parse_args(argv)
+    budget = Budget(args.budget, args.memory_mb, args.fallback_pages)
+    if args.watch:
+        watch(interval=args.interval, jobs=args.jobs, budget=budget)
+        return
+    trace = Trace()
+    index = MinHashIndex.open(args.similarity_index) if args.similarity else None
+    with profiled(args.profile):
+        sections = assess_files(list_submissions(), jobs=args.jobs, trace=trace, budget=budget, similarity=index,
+                                cohort=args.cohort, similarity_threshold=args.similarity_threshold)
+        with trace.stage(OUT_QMD.name, 'write') as rec:
+            text = HEADER + '\n'.join(sections)
+            OUT_QMD.write_text(text, encoding='utf-8')
+            rec['bytes'] = len(text.encode('utf-8'))
     print(f"Wrote {OUT_QMD}")
+    if index is not None:
+        index.save(args.similarity_index)
+        print(f"Similarity index ({len(index.ids)} submissions) saved to {args.similarity_index}")
+    if args.trace:
+        trace.write(args.trace)
+        trace.print_summary()
+        print(f"Trace written to {args.trace}")
 
 if __name__ == '__main__':
     main()
-
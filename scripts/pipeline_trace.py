@@ -0,0 +1,129 @@
+"""Lightweight per-file, per-stage timing for the A3 batch scripts.
+
+Wrap each unit of work in `trace.stage(file, stage)`; the record gets wall
+time, CPU time of the running thread, and any fields the code inside adds
+(bytes of text, pages, subprocess exit code). Extractors deep in the call
+stack can attach fields with `annotate(...)` without being passed the
+record. Records from worker processes are plain dicts and can be merged with
+`Trace.extend`. The trace is written as JSON or CSV, by file suffix.
+
+    trace = Trace()
+    with trace.stage('alice.pdf', 'extract') as rec:
+        text = extract(path)
+        rec['bytes'] = len(text.encode())
+    trace.write('trace.json')
+    trace.print_summary()
+"""
+from __future__ import annotations
+
+import cProfile
+import csv
+import json
+import os
+import pstats
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional
+
+FIELDS = ['file', 'stage', 'wall_s', 'cpu_s', 'bytes', 'exit_code', 'error']
+
+_current = threading.local()
+
+
+def annotate(**fields) -> None:
+    """Attach fields to the innermost open stage on this thread (no-op outside one)."""
+    rec = getattr(_current, 'record', None)
+    if rec is not None:
+        rec.update(fields)
+
+
+class Trace:
+    def __init__(self):
+        self.records: List[Dict] = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def stage(self, file: str, stage: str, **fields) -> Iterator[Dict]:
+        """Time the enclosed block; exceptions are recorded in 'error' and re-raised."""
+        rec = {'file': str(file), 'stage': stage, **fields}
+        outer = getattr(_current, 'record', None)
+        _current.record = rec
+        wall0, cpu0 = time.perf_counter(), time.thread_time()
+        try:
+            yield rec
+        except BaseException as e:
+            rec.setdefault('error', f'{type(e).__name__}: {e}')
+            raise
+        finally:
+            rec['wall_s'] = time.perf_counter() - wall0
+            rec['cpu_s'] = time.thread_time() - cpu0
+            _current.record = outer
+            with self._lock:
+                self.records.append(rec)
+
+    def extend(self, records: Iterable[Dict]) -> None:
+        with self._lock:
+            self.records.extend(records)
+
+    def totals(self) -> Dict[str, Dict[str, float]]:
+        """Per-stage count, wall and CPU seconds."""
+        out: Dict[str, Dict[str, float]] = {}
+        for rec in self.records:
+            t = out.setdefault(rec['stage'], {'count': 0, 'wall_s': 0.0, 'cpu_s': 0.0})
+            t['count'] += 1
+            t['wall_s'] += rec['wall_s']
+            t['cpu_s'] += rec['cpu_s']
+        return out
+
+    def slowest(self, n: int = 5) -> List[Dict]:
+        """The n files with the largest total wall time over all their stages."""
+        per_file: Dict[str, float] = {}
+        for rec in self.records:
+            per_file[rec['file']] = per_file.get(rec['file'], 0.0) + rec['wall_s']
+        ranked = sorted(per_file.items(), key=lambda kv: kv[1], reverse=True)[:n]
+        return [{'file': f, 'wall_s': w} for f, w in ranked]
+
+    def print_summary(self, n: int = 5) -> None:
+        print('\nstage         count     wall s      cpu s')
+        for stage, t in self.totals().items():
+            print(f"{stage:<12}{t['count']:>6}{t['wall_s']:>11.3f}{t['cpu_s']:>11.3f}")
+        slow = self.slowest(n)
+        if slow:
+            print('slowest files:')
+            for row in slow:
+                print(f"  {row['wall_s']:8.3f}s  {row['file']}")
+
+    def write(self, path: Path) -> None:
+        """Write records as CSV if `path` ends in .csv, otherwise as JSON (atomically)."""
+        path = Path(path)
+        tmp = path.with_name(path.name + '.tmp')
+        if path.suffix.lower() == '.csv':
+            extra = sorted({k for rec in self.records for k in rec} - set(FIELDS))
+            with open(tmp, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.DictWriter(f, fieldnames=FIELDS + extra)
+                writer.writeheader()
+                writer.writerows(self.records)
+        else:
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump({'totals': self.totals(), 'records': self.records}, f, indent=2)
+        os.replace(tmp, path)
+
+
+@contextmanager
+def profiled(path: Optional[Path], top: int = 20) -> Iterator[None]:
+    """Run the block under cProfile if `path` is given, dump stats there and
+    print the `top` entries by cumulative time. Only the calling thread is profiled."""
+    if path is None:
+        yield
+        return
+    prof = cProfile.Profile()
+    prof.enable()
+    try:
+        yield
+    finally:
+        prof.disable()
+        prof.dump_stats(str(path))
+        print(f'\nProfile written to {path}')
+        pstats.Stats(prof).sort_stats('cumulative').print_stats(top)
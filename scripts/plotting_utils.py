@@ -1,20 +1,55 @@
+from __future__ import annotations
+
+import importlib
+import json
+import os
+import re
+import sys
 import warnings
+from collections import Counter, deque
+from functools import lru_cache
+from itertools import islice
+from pathlib import Path
+from statistics import NormalDist
 from typing import Iterable, Optional, Tuple
 
 import numpy as np
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-from matplotlib.colors import ListedColormap
 
-try:
-    from sklearn.model_selection import learning_curve, validation_curve
-except Exception:  # pragma: no cover - optional at authoring time
-    learning_curve = None
-    validation_curve = None
+
+class _LazyModule:
+    """Stand-in for a module that is imported on first attribute access.
+
+    Keeps `import plotting_utils` cheap: matplotlib, seaborn and pandas are
+    only loaded by the helpers that actually draw or aggregate.
+    """
+
+    def __init__(self, name: str):
+        self._name = name
+
+    def __getattr__(self, attr):
+        module = importlib.import_module(self._name)
+        return getattr(module, attr)
+
+
+pd = _LazyModule("pandas")
+plt = _LazyModule("matplotlib.pyplot")
+sns = _LazyModule("seaborn")
+
+_STYLE_APPLIED = False
+
+
+def _sklearn_curve(name: str):
+    try:
+        return getattr(importlib.import_module("sklearn.model_selection"), name)
+    except Exception:  # pragma: no cover - optional at authoring time
+        return None
 
 
-def set_style():
+def set_style(force: bool = False):
+    """Apply the course plot style once per process (pass force=True to re-apply)."""
+    global _STYLE_APPLIED
+    if _STYLE_APPLIED and not force:
+        return
     sns.set_theme(style="whitegrid", context="notebook")
     plt.rcParams.update({
         "figure.figsize": (8, 5),
@@ -23,27 +58,55 @@ def set_style():
         "legend.fontsize": 10,
         "figure.dpi": 120,
     })
+    _STYLE_APPLIED = True
 
 
-def plot_cv_folds(n_samples: int, cv_splits: Iterable[Tuple[np.ndarray, np.ndarray]], title: str = "Cross-validation folds"):
+def _fold_row(n_samples: int, width: int, train_idx: np.ndarray, test_idx: np.ndarray) -> np.ndarray:
+    """One image row of `width` pixels: 2 if a pixel's samples include test
+    indices, else 1 if they include train indices, else 0 (unused)."""
+    row = np.zeros(width, dtype=np.uint8)
+    for value, idx in ((1, train_idx), (2, test_idx)):
+        idx = np.asarray(idx)
+        if idx.dtype == bool:
+            idx = np.flatnonzero(idx)
+        if idx.size:
+            # Bin sample indices into pixel columns; no per-sample matrix
+            hit = np.bincount(idx.astype(np.int64) * width // n_samples, minlength=width) > 0
+            row[hit] = value
+    return row
+
+
+def plot_cv_folds(
+    n_samples: int,
+    cv_splits: Iterable[Tuple[np.ndarray, np.ndarray]],
+    title: str = "Cross-validation folds",
+    max_width: Optional[int] = None,
+):
     """Visualize train/test membership across CV splits.
 
     Parameters
     ----------
     n_samples: total number of samples
-    cv_splits: iterable of (train_idx, test_idx)
+    cv_splits: iterable of (train_idx, test_idx); consumed lazily, one split at a time
     title: plot title
+    max_width: image width in pixels (default: the current figure's pixel width).
+        Samples are binned into at most this many columns, so memory and drawing
+        time depend on figure resolution rather than n_samples.
     """
     set_style()
-    # Materialize splits once for reuse
-    splits = list(cv_splits)
-    fold_matrix = np.zeros((len(splits), n_samples), dtype=int)
-    for i, (train_idx, test_idx) in enumerate(splits):
-        fold_matrix[i, train_idx] = 1  # train
-        fold_matrix[i, test_idx] = 2  # test
+    fig = plt.gcf()
+    if max_width is None:
+        max_width = int(np.ceil(fig.get_figwidth() * fig.dpi))
+    width = max(1, min(n_samples, max_width))
+    rows = [_fold_row(n_samples, width, train_idx, test_idx) for train_idx, test_idx in cv_splits]
+    fold_matrix = np.vstack(rows) if rows else np.zeros((0, width), dtype=np.uint8)
+    n_splits = len(rows)
+    from matplotlib.colors import ListedColormap
+
     cmap = ListedColormap(["#e0e0e0", "#4CAF50", "#F44336"])
-    plt.imshow(fold_matrix, aspect="auto", interpolation="nearest", cmap=cmap, vmin=0, vmax=2)
-    plt.yticks(range(len(splits)), [f"Fold {i+1}" for i in range(len(splits))])
+    plt.imshow(fold_matrix, aspect="auto", interpolation="nearest", cmap=cmap, vmin=0, vmax=2,
+               extent=(-0.5, n_samples - 0.5, n_splits - 0.5, -0.5))
+    plt.yticks(range(n_splits), [f"Fold {i+1}" for i in range(n_splits)])
     plt.xticks([])
     plt.xlabel("Sample index")
     plt.title(title)
@@ -51,32 +114,52 @@ def plot_cv_folds(n_samples: int, cv_splits: Iterable[Tuple[np.ndarray, np.ndarr
     return plt.gca()
 
 
+@lru_cache(maxsize=None)
+def _normal_quantile(p: float) -> float:
+    # Standard-library inverse normal CDF; avoids importing scipy per call
+    return NormalDist().inv_cdf(p)
+
+
 def plot_error_bars(
-    df: pd.DataFrame,
+    df,
     group_col: str,
     value_col: str,
     ci: float = 0.95,
     agg: str = "mean",
     title: Optional[str] = None,
+    sample_size: int = 4096,
 ):
-    """Grouped bar chart with error bars (CI by normal approx)."""
+    """Grouped bar chart with error bars.
+
+    `df` may be a DataFrame or an iterable of DataFrame chunks (e.g.
+    ``pd.read_csv(path, chunksize=100_000)``); statistics are accumulated in a
+    single pass with bounded memory (see streaming_stats.GroupedStats).
+    agg="mean" draws means with a normal-approximation CI; agg="median" or a
+    percentile such as "p90" draws that quantile, estimated from a uniform
+    sample of up to `sample_size` values per group, with an order-statistic CI.
+    """
+    from streaming_stats import GroupedStats, iter_frames, parse_quantile
+
     set_style()
-    grouped = df.groupby(group_col)[value_col]
-    means = grouped.mean()
-    counts = grouped.count()
-    stds = grouped.std(ddof=1)
-    # Normal approximation CI
-    try:
-        from scipy.stats import norm
-        z = float(norm.ppf(0.5 + ci / 2.0))
-    except Exception:
-        # Fallback to standard normal z for 95% CI if SciPy not installed
-        z = 1.96 if abs(ci - 0.95) < 1e-6 else 1.96
-    se = stds / np.sqrt(counts)
-    ci_half = z * se
+    q = parse_quantile(agg)
+    stats = GroupedStats(sample_size=sample_size if q is not None else 0)
+    for chunk in iter_frames(df):
+        stats.update(chunk[group_col], chunk[value_col])
+    z = _normal_quantile(0.5 + ci / 2.0)
+    if q is None:
+        summary = stats.summary()
+        values = summary["mean"]
+        # Normal approximation CI
+        yerr = z * summary["std"] / np.sqrt(summary["count"])
+    else:
+        interval = stats.quantile_interval(q, z)
+        values = interval["value"]
+        yerr = np.vstack([values - interval["lower"], interval["upper"] - values])
+    values.index.name = group_col
+    values.name = value_col
 
-    ax = means.plot(kind="bar", yerr=ci_half, capsize=5, color="#64B5F6")
-    ax.set_ylabel(value_col)
+    ax = values.plot(kind="bar", yerr=yerr, capsize=5, color="#64B5F6")
+    ax.set_ylabel(value_col if q is None else f"{value_col} ({agg})")
     ax.set_xlabel(group_col)
     if title:
         ax.set_title(title)
@@ -84,6 +167,72 @@ def plot_error_bars(
     return ax
 
 
+def plot_binned_density(
+    data,
+    x: str,
+    y: str,
+    color: Optional[str] = None,
+    facet=None,
+    bins: int = 80,
+    x_range: Optional[Tuple[float, float]] = None,
+    y_range: Optional[Tuple[float, float]] = None,
+    min_count: int = 5,
+    cmap: str = "viridis",
+):
+    """Density (and optional per-bin mean of `color`) of x vs y on a fixed grid.
+
+    Designed for very large frames, e.g. wwr vs eui_kwh_m2 from
+    simulate_building_performance: points are binned with vectorised NumPy
+    (see streaming_stats.BinnedStats2D) and only the bins x bins grid is drawn,
+    so render time barely depends on the number of rows. `data` may also be an
+    iterable of DataFrame chunks, in which case x_range and y_range are required.
+    `facet` is a column name or list of names (e.g. "orientation" or
+    ["orientation", "climate_zone"]); each facet gets its own row of panels.
+    Bins with fewer than `min_count` points are left blank in the mean panel.
+    """
+    from matplotlib.colors import LogNorm
+    from streaming_stats import BinnedStats2D, iter_frames
+
+    set_style()
+    if x_range is None or y_range is None:
+        if not isinstance(data, pd.DataFrame):
+            raise ValueError("x_range and y_range are required when data is an iterable of chunks")
+        x_range = x_range or (float(data[x].min()), float(data[x].max()))
+        y_range = y_range or (float(data[y].min()), float(data[y].max()))
+    stats = BinnedStats2D(x_range, y_range, bins)
+    for chunk in iter_frames(data):
+        stats.update(
+            chunk[x].to_numpy(),
+            chunk[y].to_numpy(),
+            None if color is None else chunk[color].to_numpy(),
+            None if facet is None else chunk[facet],
+        )
+
+    facets = stats.facets()
+    ncols = 1 if color is None else 2
+    width, height = plt.rcParams["figure.figsize"]
+    fig, axes = plt.subplots(len(facets), ncols, squeeze=False, sharex=True, sharey=True,
+                             figsize=(width * ncols * 0.75, max(height * 0.6 * len(facets), height)))
+    for row, key in zip(axes, facets):
+        label = "" if key is None else (" / ".join(map(str, key)) if isinstance(key, tuple) else str(key)) + ": "
+        counts = stats.counts(key)
+        mesh = row[0].pcolormesh(stats.x_edges, stats.y_edges, np.ma.masked_equal(counts, 0).T,
+                                 norm=LogNorm(), cmap=cmap)
+        fig.colorbar(mesh, ax=row[0], label="count")
+        row[0].set_title(f"{label}density")
+        if color is not None:
+            means = np.ma.masked_invalid(stats.means(key, min_count=min_count))
+            mesh = row[1].pcolormesh(stats.x_edges, stats.y_edges, means.T, cmap=cmap)
+            fig.colorbar(mesh, ax=row[1], label=f"mean {color}")
+            row[1].set_title(f"{label}mean {color}")
+        for ax in row:
+            ax.set_ylabel(y)
+    for ax in axes[-1]:
+        ax.set_xlabel(x)
+    fig.tight_layout()
+    return axes
+
+
 def confusion_matrix_plot(cm: np.ndarray, class_names: Tuple[str, str] = ("Negative", "Positive"), title: str = "Confusion Matrix"):
     set_style()
     ax = sns.heatmap(cm, annot=True, fmt="d", cmap="Blues", cbar=False,
@@ -95,18 +244,155 @@ def confusion_matrix_plot(cm: np.ndarray, class_names: Tuple[str, str] = ("Negat
     return ax
 
 
-def learning_curve_plot(estimator, X, y, cv=5, scoring=None, train_sizes=np.linspace(0.1, 1.0, 5)):
+CURVE_CACHE_DIR = Path(__file__).resolve().parent.parent / ".cache" / "curves"
+
+
+def _materialize_cv(cv):
+    # A one-shot iterable of splits must be listed before it is both hashed and fitted
+    if isinstance(cv, int) or hasattr(cv, "split") or isinstance(cv, list):
+        return cv
+    return list(cv)
+
+
+def _is_reproducible_cv(cv) -> bool:
+    """False for splitters that reshuffle on every call (e.g. ShuffleSplit() or KFold(shuffle=True) unseeded)."""
+    if not hasattr(cv, "split"):
+        return True
+    return getattr(cv, "random_state", 0) is not None or not getattr(cv, "shuffle", True)
+
+
+def _range_array(values: list) -> np.ndarray:
+    # Numeric ranges stay numeric for plotting; anything else (None, strings, mixed) is kept as objects
+    if all(isinstance(v, (int, float, np.number)) and not isinstance(v, bool) for v in values):
+        return np.asarray(values)
+    return np.array(values, dtype=object)
+
+
+def _curve_cache_key(kind: str, estimator, X, y, cv, scoring, **extra) -> str:
+    """Fingerprint of everything that determines a curve's scores."""
+    import joblib
+
+    if isinstance(cv, list):
+        # Explicit (train, test) index arrays: hash the indices themselves
+        cv = [tuple(np.asarray(a) for a in split) for split in cv]
+    else:
+        cv = repr(cv)
+    return joblib.hash((
+        kind,
+        type(estimator).__module__,
+        type(estimator).__qualname__,
+        repr(sorted(estimator.get_params(deep=True).items(), key=lambda kv: kv[0])),
+        joblib.hash(X),
+        joblib.hash(y),
+        cv,
+        scoring,
+        extra,
+    ))
+
+
+def _cached_scores(cache_dir: Optional[Path], key: str, compute) -> dict:
+    if cache_dir is None:
+        return compute()
+    path = Path(cache_dir) / f"{key}.npz"
+    if path.exists():
+        return load_curve_scores(path)
+    result = compute()
+    save_curve_scores(result, path)
+    return result
+
+
+def save_curve_scores(result: dict, path) -> Path:
+    """Save a compute_*_curve result so it can be plotted elsewhere.
+
+    `param_range` is stored as JSON, so ranges such as [None, 2, 4] load
+    without pickling; values JSON cannot represent raise TypeError.
+    """
+    path = Path(path)
+    arrays = dict(result)
+    if "param_range" in arrays:
+        arrays["param_range"] = np.asarray(json.dumps(np.asarray(arrays["param_range"]).tolist()))
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp.npz")
+    np.savez(tmp, **arrays)
+    os.replace(tmp, path)
+    return path
+
+
+def load_curve_scores(path) -> dict:
+    with np.load(path, allow_pickle=False) as data:
+        result = {k: data[k] for k in data.files}
+    if "param_name" in result:
+        result["param_name"] = str(result["param_name"])
+    if "param_range" in result:
+        result["param_range"] = _range_array(json.loads(str(result["param_range"])))
+    return result
+
+
+def compute_learning_curve(estimator, X, y, cv=5, scoring=None, train_sizes=np.linspace(0.1, 1.0, 5),
+                           n_jobs=None, cache_dir: Optional[Path] = None):
+    """Learning-curve scores as a dict of arrays (sizes, train_scores, test_scores).
+
+    Folds are fitted in parallel with `n_jobs`. With a `cache_dir` (e.g.
+    CURVE_CACHE_DIR) results are memoised on disk, keyed by estimator
+    parameters, data, CV scheme, scoring and train sizes. Splitters that
+    shuffle without a random_state are never cached.
+    """
+    learning_curve = _sklearn_curve("learning_curve")
     if learning_curve is None:
         warnings.warn("sklearn not available for learning_curve; skipping.")
         return None
+    cv = _materialize_cv(cv)
+
+    def compute():
+        sizes, train_scores, test_scores = learning_curve(
+            estimator, X, y, cv=cv, scoring=scoring, train_sizes=train_sizes, n_jobs=n_jobs, shuffle=True, random_state=42
+        )
+        return {"sizes": sizes, "train_scores": train_scores, "test_scores": test_scores}
+
+    if cache_dir is None or not _is_reproducible_cv(cv):
+        return compute()
+    key = _curve_cache_key("learning", estimator, X, y, cv, scoring, train_sizes=np.asarray(train_sizes).tolist())
+    return _cached_scores(cache_dir, key, compute)
+
+
+def compute_validation_curve(estimator, X, y, param_name: str, param_range: Iterable, cv=5, scoring=None,
+                             n_jobs=None, cache_dir: Optional[Path] = None):
+    """Validation-curve scores as a dict of arrays (param_name, param_range, train_scores, test_scores).
+
+    Parallelism and caching work as in compute_learning_curve.
+    """
+    validation_curve = _sklearn_curve("validation_curve")
+    if validation_curve is None:
+        warnings.warn("sklearn not available for validation_curve; skipping.")
+        return None
+    param_range = list(param_range)
+    cv = _materialize_cv(cv)
+
+    def compute():
+        train_scores, test_scores = validation_curve(
+            estimator, X, y, param_name=param_name, param_range=param_range, cv=cv, scoring=scoring, n_jobs=n_jobs
+        )
+        return {"param_name": param_name, "param_range": _range_array(param_range),
+                "train_scores": train_scores, "test_scores": test_scores}
+
+    if cache_dir is None or not _is_reproducible_cv(cv):
+        return compute()
+    try:
+        json.dumps(param_range)
+    except TypeError:  # e.g. estimator objects as values: not storable without pickling
+        return compute()
+    key = _curve_cache_key("validation", estimator, X, y, cv, scoring, param_name=param_name,
+                           param_range=repr(param_range))
+    return _cached_scores(cache_dir, key, compute)
+
+
+def plot_learning_curve(result: dict, scoring=None):
+    """Plot scores from compute_learning_curve (or load_curve_scores)."""
     set_style()
-    sizes, train_scores, test_scores = learning_curve(
-        estimator, X, y, cv=cv, scoring=scoring, train_sizes=train_sizes, n_jobs=None, shuffle=True, random_state=42
-    )
-    train_mean = train_scores.mean(axis=1)
-    test_mean = test_scores.mean(axis=1)
-    plt.plot(sizes, train_mean, "o-", label="Train")
-    plt.plot(sizes, test_mean, "o-", label="CV")
+    train_mean = result["train_scores"].mean(axis=1)
+    test_mean = result["test_scores"].mean(axis=1)
+    plt.plot(result["sizes"], train_mean, "o-", label="Train")
+    plt.plot(result["sizes"], test_mean, "o-", label="CV")
     plt.xlabel("Training examples")
     plt.ylabel(scoring or "Score")
     plt.title("Learning Curve")
@@ -115,19 +401,14 @@ def learning_curve_plot(estimator, X, y, cv=5, scoring=None, train_sizes=np.lins
     return plt.gca()
 
 
-def validation_curve_plot(estimator, X, y, param_name: str, param_range: Iterable, cv=5, scoring=None):
-    if validation_curve is None:
-        warnings.warn("sklearn not available for validation_curve; skipping.")
-        return None
+def plot_validation_curve(result: dict, scoring=None):
+    """Plot scores from compute_validation_curve (or load_curve_scores)."""
     set_style()
-    train_scores, test_scores = validation_curve(
-        estimator, X, y, param_name=param_name, param_range=param_range, cv=cv, scoring=scoring, n_jobs=None
-    )
-    train_mean = train_scores.mean(axis=1)
-    test_mean = test_scores.mean(axis=1)
-    plt.semilogx(param_range, train_mean, "o-", label="Train")
-    plt.semilogx(param_range, test_mean, "o-", label="CV")
-    plt.xlabel(param_name)
+    train_mean = result["train_scores"].mean(axis=1)
+    test_mean = result["test_scores"].mean(axis=1)
+    plt.semilogx(result["param_range"], train_mean, "o-", label="Train")
+    plt.semilogx(result["param_range"], test_mean, "o-", label="CV")
+    plt.xlabel(result["param_name"])
     plt.ylabel(scoring or "Score")
     plt.title("Validation Curve")
     plt.legend()
@@ -135,14 +416,145 @@ def validation_curve_plot(estimator, X, y, param_name: str, param_range: Iterabl
     return plt.gca()
 
 
-def wordcloud_from_series(series: pd.Series, max_words: int = 100):
-    """Generate a word cloud from a pandas Series of text. Falls back to frequency bar chart if wordcloud not installed."""
+def plot_learning_curve_from_estimator(estimator, X, y, cv=5, scoring=None, train_sizes=np.linspace(0.1, 1.0, 5),
+                                       n_jobs=None, cache_dir: Optional[Path] = None):
+    """compute_learning_curve followed by plot_learning_curve."""
+    result = compute_learning_curve(estimator, X, y, cv=cv, scoring=scoring, train_sizes=train_sizes,
+                                    n_jobs=n_jobs, cache_dir=cache_dir)
+    if result is None:
+        return None
+    return plot_learning_curve(result, scoring=scoring)
+
+
+def plot_validation_curve_from_estimator(estimator, X, y, param_name: str, param_range: Iterable, cv=5,
+                                         scoring=None, n_jobs=None, cache_dir: Optional[Path] = None):
+    """compute_validation_curve followed by plot_validation_curve."""
+    result = compute_validation_curve(estimator, X, y, param_name, param_range, cv=cv, scoring=scoring,
+                                      n_jobs=n_jobs, cache_dir=cache_dir)
+    if result is None:
+        return None
+    return plot_validation_curve(result, scoring=scoring)
+
+
+# Original names, kept so existing notebooks and scripts keep working
+learning_curve_plot = plot_learning_curve_from_estimator
+validation_curve_plot = plot_validation_curve_from_estimator
+
+
+_TOKEN_RE = re.compile(r"[a-z']+")
+_FALLBACK_STOPWORDS = frozenset({"the", "and", "to", "of", "in", "for", "a", "is", "on", "with", "it", "this", "that"})
+
+
+class TokenCounter:
+    """Incremental word-frequency counter with bounded state.
+
+    Text is consumed chunk by chunk; each chunk is counted exactly and merged
+    into a summary that keeps at most `capacity` words (the most frequent so
+    far). Once the vocabulary outgrows `capacity`, counts of the retained words
+    are lower bounds, which is plenty for ranking the top few hundred words.
+    """
+
+    def __init__(self, stopwords: Iterable[str] = (), min_length: int = 1, capacity: int = 10_000):
+        self.stopwords = frozenset(stopwords)
+        self.min_length = min_length
+        self.capacity = capacity
+        self.counts: Counter = Counter()
+
+    def count_chunk(self, texts: Iterable[str]) -> Counter:
+        counts = Counter(_TOKEN_RE.findall(" ".join(texts).lower()))
+        for word in [w for w in counts if w in self.stopwords or len(w) < self.min_length]:
+            del counts[word]
+        return counts
+
+    def merge(self, counts: Counter) -> None:
+        self.counts.update(counts)
+        if len(self.counts) > self.capacity:
+            self.counts = Counter(dict(self.counts.most_common(self.capacity)))
+
+    def update(self, texts: Iterable[str]) -> None:
+        self.merge(self.count_chunk(texts))
+
+    def most_common(self, n: Optional[int] = None):
+        return self.counts.most_common(n)
+
+
+def _count_chunk(texts, stopwords, min_length, capacity) -> Counter:
+    counter = TokenCounter(stopwords, min_length, capacity)
+    counter.update(texts)
+    return counter.counts
+
+
+def _iter_text_chunks(texts, chunk_size: int):
+    # Only a Series if pandas is already loaded; don't import it to find out
+    pandas = sys.modules.get("pandas")
+    if pandas is not None and isinstance(texts, pandas.Series):
+        texts = texts.dropna()
+        for start in range(0, len(texts), chunk_size):
+            yield texts.iloc[start:start + chunk_size].astype(str).tolist()
+        return
+    it = (str(t) for t in texts if t is not None)
+    while True:
+        chunk = list(islice(it, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def token_frequencies(
+    texts,
+    stopwords: Iterable[str] = (),
+    min_length: int = 1,
+    capacity: int = 10_000,
+    chunk_size: int = 50_000,
+    workers: Optional[int] = None,
+) -> TokenCounter:
+    """Count words across a Series or any iterable of strings in bounded memory.
+
+    Chunks of `chunk_size` strings are counted in a process pool when
+    `workers` > 1 (at most 2 * workers chunks in flight) and merged into one
+    TokenCounter.
+    """
+    counter = TokenCounter(stopwords, min_length, capacity)
+    chunks = _iter_text_chunks(texts, chunk_size)
+    if not workers or workers == 1:
+        for chunk in chunks:
+            counter.update(chunk)
+        return counter
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(_count_chunk, chunk, counter.stopwords, min_length, capacity))
+            if len(pending) >= 2 * workers:
+                counter.merge(pending.popleft().result())
+        while pending:
+            counter.merge(pending.popleft().result())
+    return counter
+
+
+def wordcloud_from_series(series, max_words: int = 100, chunk_size: int = 50_000, workers: Optional[int] = None):
+    """Generate a word cloud from a pandas Series (or any iterable) of text. Falls back to frequency bar chart if wordcloud not installed.
+
+    Words are counted incrementally (see token_frequencies) and WordCloud is
+    fed the frequencies directly, so the corpus is never joined into one string.
+    """
     set_style()
     try:
         from wordcloud import WordCloud, STOPWORDS
-        text = " ".join(series.dropna().astype(str))
-        wc = WordCloud(width=800, height=400, max_words=max_words, background_color="white",
-                       stopwords=STOPWORDS | {"the", "and", "to", "of", "in", "for"}).generate(text)
+        stopwords = STOPWORDS | {"the", "and", "to", "of", "in", "for"}
+        min_length = 2
+    except Exception:
+        WordCloud = None
+        stopwords = _FALLBACK_STOPWORDS
+        min_length = 3
+    freqs = token_frequencies(series, stopwords=stopwords, min_length=min_length,
+                              capacity=max(10_000, 10 * max_words), chunk_size=chunk_size, workers=workers)
+    try:
+        if WordCloud is None:
+            raise ImportError("wordcloud not installed")
+        wc = WordCloud(width=800, height=400, max_words=max_words, background_color="white")
+        wc.generate_from_frequencies(dict(freqs.most_common(max_words)))
         plt.imshow(wc, interpolation="bilinear")
         plt.axis("off")
         plt.title("Word Cloud")
@@ -150,14 +562,7 @@ def wordcloud_from_series(series: pd.Series, max_words: int = 100):
         return plt.gca()
     except Exception:
         # Fallback: simple frequency bar chart
-        from collections import Counter
-        import re
-        tokens = []
-        for t in series.dropna().astype(str):
-            tokens.extend([w.lower() for w in re.findall(r"[A-Za-z']+", t)])
-        stop = {"the", "and", "to", "of", "in", "for", "a", "is", "on", "with", "it", "this", "that"}
-        words = [w for w in tokens if w not in stop and len(w) > 2]
-        top = Counter(words).most_common(20)
+        top = [(w, c) for w, c in freqs.most_common() if w not in _FALLBACK_STOPWORDS and len(w) > 2][:20]
         if not top:
             plt.text(0.5, 0.5, "No words to display", ha="center")
             plt.axis("off")
@@ -1,74 +1,215 @@
 #!/usr/bin/env python3
+import argparse
+import os
+import re
 import sys
+import tempfile
+import time
 import zipfile
 import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+class _EscapeTable(dict):
+    """str.translate table that memoises the \\uN? escape of each code point it sees."""
+    def __missing__(self, code: int) -> str:
+        self[code] = esc = f"\\u{code}?"
+        return esc
+
+_ESCAPES = _EscapeTable()
+_NON_PRINTABLE_ASCII = re.compile('[^\x20-\x7e]+')
+
+def _escape_run(m) -> str:
+    return m.group().translate(_ESCAPES)
 
 def rtf_escape(s: str) -> str:
-    out = []
-    for ch in s:
-        code = ord(ch)
-        if ch in ['\\', '{', '}']:
-            out.append('\\' + ch)
-        elif 0x20 <= code <= 0x7E:
-            out.append(ch)
-        else:
-            out.append(f"\\u{code}?")
-    return ''.join(out)
+    # Bulk C-level replaces for the three RTF specials, then fall back to the
+    # translate table only for runs of control or non-ASCII characters.
+    if '\\' in s:
+        s = s.replace('\\', '\\\\')
+    if '{' in s:
+        s = s.replace('{', '\\{')
+    if '}' in s:
+        s = s.replace('}', '\\}')
+    if s.isascii() and s.isprintable():
+        return s
+    return _NON_PRINTABLE_ASCII.sub(_escape_run, s)
+
+def _local(tag: str) -> str:
+    return tag.rsplit('}', 1)[-1]
+
+def slide_paths(z: zipfile.ZipFile) -> List[str]:
+    return sorted([p for p in z.namelist() if p.startswith('ppt/slides/slide') and p.endswith('.xml')],
+                  key=lambda p: int(Path(p).stem.replace('slide','')))
+
+def xml_paragraphs(f) -> List[str]:
+    """Non-empty paragraphs (<a:p>/<w:p>) of a DrawingML slide or a Word document part."""
+    # Incremental parse: every element is cleared and detached from its
+    # parent as soon as it ends, so the slide tree is never held in memory
+    # (clearing alone would leave an empty shell per element) and each run is
+    # visited once. Paragraph slots are reserved on open to keep document order.
+    paragraphs: List[List[str]] = []
+    open_paras: List[int] = []
+    open_elems = []
+    for event, elem in ET.iterparse(f, events=('start', 'end')):
+        tag = _local(elem.tag)
+        if event == 'start':
+            open_elems.append(elem)
+            if tag == 'p':
+                open_paras.append(len(paragraphs))
+                paragraphs.append([])
+            continue
+        if tag == 't' and elem.text:
+            for i in open_paras:
+                paragraphs[i].append(elem.text)
+        elif tag == 'p':
+            open_paras.pop()
+        open_elems.pop()
+        elem.clear()
+        if open_elems:
+            open_elems[-1].remove(elem)
+    return [para for para in (''.join(runs).strip() for runs in paragraphs) if para]
 
-def extract_text_from_pptx(pptx_path: Path):
-    texts_by_slide = []
+def iter_slide_paragraphs(pptx_path: Path) -> Iterator[List[str]]:
+    """Yield the non-empty paragraphs of each slide, in slide order.
+
+    Slides whose XML cannot be parsed yield an empty list.
+    """
     with zipfile.ZipFile(pptx_path, 'r') as z:
-        # Collect slide files in order
-        slide_paths = sorted([p for p in z.namelist() if p.startswith('ppt/slides/slide') and p.endswith('.xml')],
-                             key=lambda p: int(Path(p).stem.replace('slide','')))
-        for sp in slide_paths:
+        for sp in slide_paths(z):
             with z.open(sp) as f:
                 try:
-                    tree = ET.parse(f)
+                    paragraphs = xml_paragraphs(f)
                 except ET.ParseError:
-                    texts_by_slide.append([])
-                    continue
-            root = tree.getroot()
-            # find all paragraph nodes and join their text runs
-            # match any namespace: {namespace}t for text runs, {ns}p for paragraphs
-            paragraphs = []
-            for p in root.findall('.//{*}p'):
-                runs = []
-                for t in p.findall('.//{*}t'):
-                    if t.text:
-                        runs.append(t.text)
-                para = ''.join(runs).strip()
-                if para:
-                    paragraphs.append(para)
-            texts_by_slide.append(paragraphs)
-    return texts_by_slide
-
-def write_rtf(slides, out_path: Path):
-    with open(out_path, 'w', encoding='utf-8') as f:
+                    paragraphs = []
+            yield paragraphs
+
+def extract_text_from_pptx(pptx_path: Path) -> List[List[str]]:
+    return list(iter_slide_paragraphs(pptx_path))
+
+WRITE_BUFFER = 1 << 20
+
+def write_rtf(slides: Iterable[List[str]], out_path: Path):
+    """Write slides (an iterable of paragraph lists, consumed lazily) as RTF."""
+    with open(out_path, 'w', encoding='utf-8', buffering=WRITE_BUFFER) as f:
         f.write('{\\rtf1\\ansi\\deff0{\\fonttbl{\\f0 Arial;}}\n')
         f.write('\\fs22 ')
         for idx, paras in enumerate(slides, start=1):
-            f.write('\\b ' + rtf_escape(f'Slide {idx}') + ' \\b0\\par\n')
+            chunk = ['\\b ' + rtf_escape(f'Slide {idx}') + ' \\b0\\par\n']
             if not paras:
-                f.write(rtf_escape(' (no visible text)') + '\\par\n')
-                continue
-            for para in paras:
-                line = rtf_escape(' - ' + para)
-                f.write(line + '\\par\n')
-            f.write('\\par\n')
+                chunk.append(rtf_escape(' (no visible text)') + '\\par\n')
+            else:
+                chunk.extend(rtf_escape(' - ' + para) + '\\par\n' for para in paras)
+                chunk.append('\\par\n')
+            f.write(''.join(chunk))
         f.write('}\n')
 
-def main():
-    if len(sys.argv) != 3:
-        print('Usage: pptx_to_rtf.py input.pptx output.rtf', file=sys.stderr)
-        sys.exit(2)
-    inp = Path(sys.argv[1])
-    out = Path(sys.argv[2])
-    slides = extract_text_from_pptx(inp)
+def convert(inp: Path, out: Path):
     out.parent.mkdir(parents=True, exist_ok=True)
-    write_rtf(slides, out)
+    # Write beside the target and rename, so a failed conversion never leaves
+    # a partial RTF that looks newer than its source.
+    # The temp name is unique per call, so concurrent workers never share one.
+    fd, tmp = tempfile.mkstemp(dir=out.parent, prefix=out.name + '.', suffix='.part')
+    os.close(fd)
+    tmp = Path(tmp)
+    try:
+        write_rtf(iter_slide_paragraphs(inp), tmp)
+        os.replace(tmp, out)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+
+def _convert_timed(inp: Path, out: Path) -> Tuple[Path, float, Optional[str]]:
+    t0 = time.perf_counter()
+    try:
+        convert(inp, out)
+        error = None
+    except Exception as e:
+        error = str(e)
+    return inp, time.perf_counter() - t0, error
+
+def is_glob(source: str) -> bool:
+    return any(c in source for c in '*?[')
+
+def find_decks(source: str) -> Tuple[Path, List[Path]]:
+    """(root, decks) for a directory or glob pattern; outputs mirror paths below root."""
+    src = Path(source)
+    if src.is_dir():
+        return src, sorted(src.glob('*.pptx'))
+    if not is_glob(source):
+        raise FileNotFoundError(f'No such file or directory: {source}')
+    # A glob pattern, e.g. 'lectures/**/*.pptx'; its root is the part before the first wildcard
+    anchor = Path(src.anchor or '.')
+    parts = src.relative_to(anchor).parts if src.anchor else src.parts
+    fixed = next(i for i, part in enumerate(parts) if is_glob(part))
+    root = anchor.joinpath(*parts[:fixed])
+    pattern = str(Path(*parts[fixed:]))
+    return root, sorted(p for p in root.glob(pattern) if p.suffix.lower() == '.pptx')
+
+def is_stale(inp: Path, out: Path) -> bool:
+    return not out.exists() or out.stat().st_mtime_ns < inp.stat().st_mtime_ns
+
+def convert_batch(source: str, out_dir: Path, jobs: Optional[int] = None, force: bool = False) -> int:
+    """Convert every deck matched by `source` into `out_dir`, make-style.
+
+    Each RTF mirrors its deck's path below the directory (or the fixed part
+    of the glob), so same-named decks in different folders do not collide.
+    Decks whose RTF is newer than the .pptx are skipped unless `force`.
+    Returns the number of failed conversions; raises FileNotFoundError when
+    `source` matches no deck.
+    """
+    root, decks = find_decks(source)
+    if not decks:
+        raise FileNotFoundError(f'No .pptx decks match {source}')
+    todo = [(d, out_dir / d.relative_to(root).with_suffix('.rtf')) for d in decks]
+    if not force:
+        todo = [(d, o) for d, o in todo if is_stale(d, o)]
+    print(f'{len(decks)} decks found, {len(decks) - len(todo)} up to date, {len(todo)} to convert')
+    if not todo:
+        return 0
+
+    t0 = time.perf_counter()
+    if (jobs or os.cpu_count() or 1) == 1 or len(todo) == 1:
+        results = [_convert_timed(d, o) for d, o in todo]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = list(pool.map(_convert_timed, *zip(*todo)))
+    wall = time.perf_counter() - t0
+
+    failed = 0
+    for inp, seconds, error in sorted(results, key=lambda r: r[1], reverse=True):
+        if error:
+            failed += 1
+            print(f'  FAILED {seconds:7.2f}s  {inp.relative_to(root)}: {error}', file=sys.stderr)
+        else:
+            print(f'  ok     {seconds:7.2f}s  {inp.relative_to(root)}')
+    print(f'Converted {len(results) - failed}/{len(results)} decks in {wall:.2f}s wall '
+          f'({sum(r[1] for r in results):.2f}s total)')
+    return failed
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Convert PPTX slide text to RTF.',
+        usage='pptx_to_rtf.py input.pptx output.rtf\n'
+              '       pptx_to_rtf.py (input_dir | "glob/*.pptx") output_dir [-j N] [--force]')
+    parser.add_argument('input')
+    parser.add_argument('output', type=Path)
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help='worker processes in batch mode (default: CPU count)')
+    parser.add_argument('--force', action='store_true', help='reconvert decks even if the RTF is newer')
+    args = parser.parse_args()
+
+    inp = Path(args.input)
+    if inp.is_file():
+        convert(inp, args.output)
+        return
+    try:
+        failed = convert_batch(args.input, args.output, jobs=args.jobs, force=args.force)
+    except FileNotFoundError as e:
+        sys.exit(f'error: {e}')
+    if failed:
+        sys.exit(1)
 
 if __name__ == '__main__':
     main()
-
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""Render course figures headlessly from a manifest, skipping unchanged ones.
+
+Each manifest entry names a plotting_utils function, a dataset and keyword
+arguments. Figures are drawn on the Agg backend in a process pool and saved
+as PNG/SVG. An entry is redrawn only when the hash of its inputs changes:
+the entry itself, the dataset's bytes and the plotting helpers' source. After
+editing one dataset, only the figures that read it are redrawn.
+
+Manifest (JSON), e.g. figures.json:
+
+    [
+      {"name": "eui_by_orientation",
+       "function": "plot_error_bars",
+       "data": "data/building_performance_fake.csv",
+       "kwargs": {"group_col": "orientation", "value_col": "eui_kwh_m2"},
+       "formats": ["png", "svg"]},
+      {"name": "survey_words",
+       "function": "wordcloud_from_series",
+       "data": "data/survey_responses_fake.csv",
+       "column": "response_text"}
+    ]
+
+Usage: python scripts/render_figures.py [figures.json] [-o figures] [-j N] [--force]
+
+This is an explicit step, not part of `quarto render`: run it after changing
+the manifest or a dataset. The output directory is generated and ignored.
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from text_cache import file_digest
+
+ROOT = Path(__file__).resolve().parent.parent
+SCRIPTS = Path(__file__).resolve().parent
+DEFAULT_MANIFEST = ROOT / 'figures.json'
+DEFAULT_OUT_DIR = ROOT / 'figures'
+STATE_NAME = '.render-state.json'
+# Bump to force a full redraw when the rendering logic here changes
+RENDERER_VERSION = '1'
+
+
+def load_manifest(path: Path) -> List[Dict]:
+    entries = json.loads(Path(path).read_text(encoding='utf-8'))
+    names = [e['name'] for e in entries]
+    dupes = sorted({n for n in names if names.count(n) > 1})
+    if dupes:
+        raise ValueError(f"Duplicate figure names in {path}: {', '.join(dupes)}")
+    return entries
+
+
+def _data_path(entry: Dict, base: Path) -> Optional[Path]:
+    return (base / entry['data']) if entry.get('data') else None
+
+
+def input_hash(entry: Dict, base: Path, digests: Dict[Path, str]) -> str:
+    """Hash of everything a figure depends on; dataset digests are memoised per run."""
+    h = hashlib.sha256()
+    h.update(RENDERER_VERSION.encode())
+    h.update(json.dumps(entry, sort_keys=True).encode('utf-8'))
+    for dep in filter(None, [_data_path(entry, base), SCRIPTS / 'plotting_utils.py', SCRIPTS / 'streaming_stats.py']):
+        if dep not in digests:
+            digests[dep] = file_digest(dep)
+        h.update(digests[dep].encode('ascii'))
+    return h.hexdigest()
+
+
+def load_dataset(path: Path):
+    import pandas as pd
+
+    if path.suffix == '.parquet':
+        return pd.read_parquet(path)
+    if path.suffix == '.feather':
+        return pd.read_feather(path)
+    return pd.read_csv(path)
+
+
+def _init_worker():
+    os.environ['MPLBACKEND'] = 'Agg'
+    if str(SCRIPTS) not in sys.path:
+        sys.path.insert(0, str(SCRIPTS))
+
+
+def render_one(entry: Dict, base: Path, out_dir: Path) -> Tuple[str, float, List[str]]:
+    """Draw one manifest entry and save every requested format (runs in a worker)."""
+    _init_worker()
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    import plotting_utils
+
+    t0 = time.perf_counter()
+    fn = getattr(plotting_utils, entry['function'])
+    args = []
+    data_path = _data_path(entry, base)
+    if data_path is not None:
+        data = load_dataset(data_path)
+        if entry.get('column'):
+            data = data[entry['column']]
+        args.append(data)
+    plt.close('all')
+    plt.figure()
+    fn(*args, **entry.get('kwargs', {}))
+    fig = plt.gcf()
+    if entry.get('title'):
+        fig.suptitle(entry['title'])
+    written = []
+    for fmt in entry.get('formats', ['png']):
+        path = out_dir / f"{entry['name']}.{fmt}"
+        tmp = path.with_name(f'{path.stem}.part.{fmt}')
+        fig.savefig(tmp, format=fmt, dpi=entry.get('dpi', 150), bbox_inches='tight')
+        os.replace(tmp, path)
+        written.append(path.name)
+    plt.close('all')
+    return entry['name'], time.perf_counter() - t0, written
+
+
+def render_manifest(manifest: Path = DEFAULT_MANIFEST, out_dir: Path = DEFAULT_OUT_DIR,
+                    jobs: Optional[int] = None, force: bool = False) -> int:
+    """Render stale figures; return the number of failures."""
+    manifest = Path(manifest)
+    base = manifest.resolve().parent
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    state_path = out_dir / STATE_NAME
+    try:
+        state = json.loads(state_path.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        state = {}
+
+    entries = load_manifest(manifest)
+    digests: Dict[Path, str] = {}
+    todo = []
+    for entry in entries:
+        key = input_hash(entry, base, digests)
+        outputs = [out_dir / f"{entry['name']}.{fmt}" for fmt in entry.get('formats', ['png'])]
+        if not force and state.get(entry['name']) == key and all(p.exists() for p in outputs):
+            continue
+        todo.append((entry, key))
+    print(f'{len(entries)} figures in manifest, {len(entries) - len(todo)} unchanged, {len(todo)} to render')
+
+    failed = 0
+    t0 = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker) as pool:
+        futures = {pool.submit(render_one, entry, base, out_dir): (entry, key) for entry, key in todo}
+        for future in as_completed(futures):
+            entry, key = futures[future]
+            try:
+                name, seconds, written = future.result()
+            except Exception as e:
+                failed += 1
+                state.pop(entry['name'], None)
+                print(f"  FAILED {entry['name']}: {e}", file=sys.stderr)
+                continue
+            state[name] = key
+            print(f"  {seconds:6.2f}s  {name} -> {', '.join(written)}")
+    # Drop state for figures no longer in the manifest
+    state = {k: v for k, v in state.items() if k in {e['name'] for e in entries}}
+    state_path.write_text(json.dumps(state, indent=2, sort_keys=True), encoding='utf-8')
+    if todo:
+        print(f'Rendered {len(todo) - failed}/{len(todo)} figures in {time.perf_counter() - t0:.2f}s')
+    return failed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Render figures from a manifest on the Agg backend.')
+    parser.add_argument('manifest', nargs='?', type=Path, default=DEFAULT_MANIFEST)
+    parser.add_argument('-o', '--out-dir', type=Path, default=DEFAULT_OUT_DIR)
+    parser.add_argument('-j', '--jobs', type=int, default=None, help='worker processes (default: CPU count)')
+    parser.add_argument('--force', action='store_true', help='redraw every figure')
+    args = parser.parse_args(argv)
+    if render_manifest(args.manifest, args.out_dir, args.jobs, args.force):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""Single-pass multi-keyword matching (Aho-Corasick) for rubric scanning.
+
+The automaton is compiled once from all keyword lists and then finds every
+occurrence of every keyword -- including overlapping ones such as 'refine'
+inside 'refinement' -- in one linear pass over the text. Matching is plain
+substring matching, the same as `keyword in text`.
+"""
+from __future__ import annotations
+
+from collections import deque
+from typing import Dict, Iterable, List, Tuple
+
+
+class RubricAutomaton:
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords: List[str] = list(dict.fromkeys(k for k in keywords if k))
+        goto: List[Dict[str, int]] = [{}]
+        out: List[List[int]] = [[]]
+        for idx, kw in enumerate(self.keywords):
+            state = 0
+            for ch in kw:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    out.append([])
+                state = nxt
+            out[state].append(idx)
+
+        # Breadth-first: resolve failure links and fold every state's
+        # transitions into a full DFA so scanning never follows fail links.
+        fail = [0] * len(goto)
+        delta: List[Dict[str, int]] = [dict(goto[0])] + [None] * (len(goto) - 1)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            f = fail[state]
+            out[state] = out[state] + out[f]
+            delta[state] = {**delta[f], **goto[state]}
+            for ch, nxt in goto[state].items():
+                fail[nxt] = delta[f].get(ch, 0)
+                queue.append(nxt)
+        self._delta = delta
+        self._out = [tuple(o) for o in out]
+        self._lengths = [len(k) for k in self.keywords]
+
+    def scan(self, text: str) -> Dict[str, List[int]]:
+        """Map each keyword found in `text` to the start offsets of its matches."""
+        delta = self._delta
+        out = self._out
+        found: Dict[int, List[int]] = {}
+        state = 0
+        for i, ch in enumerate(text):
+            state = delta[state].get(ch, 0)
+            if out[state]:
+                for idx in out[state]:
+                    found.setdefault(idx, []).append(i - self._lengths[idx] + 1)
+        return {self.keywords[idx]: found[idx] for idx in sorted(found)}
+
+    def counts(self, text: str) -> Dict[str, int]:
+        return {kw: len(pos) for kw, pos in self.scan(text).items()}
+
+    def matches(self, text: str) -> Tuple[List[int], List[int]]:
+        """Flat (keyword index, end offset) lists of every match, in text order.
+
+        Cheaper than scan() when only positions are needed, e.g. to bucket
+        matches by document after scanning several documents joined together.
+        """
+        delta = self._delta
+        out = self._out
+        kw_idx: List[int] = []
+        ends: List[int] = []
+        state = 0
+        for i, ch in enumerate(text):
+            state = delta[state].get(ch, 0)
+            if out[state]:
+                for idx in out[state]:
+                    kw_idx.append(idx)
+                    ends.append(i)
+        return kw_idx, ends
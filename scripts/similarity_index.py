@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""Near-duplicate detection across submissions with MinHash signatures and LSH banding.
+
+Each text is reduced to its set of word k-shingles and summarised by a
+fixed-length MinHash signature; the fraction of equal signature slots
+estimates the Jaccard similarity of two shingle sets. Signatures are split
+into bands and hashed into buckets, so only documents sharing a bucket are
+ever compared -- candidate pairs come out in roughly linear time instead of
+the quadratic all-pairs comparison. The index (signatures only, no text) is
+saved to disk and grows cohort by cohort, so new submissions are also
+checked against earlier years.
+
+Usage: python scripts/similarity_index.py TEXT_DIR --cohort 2025 [--index PATH] [--threshold 0.5]
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import re
+import zlib
+from collections import defaultdict
+from itertools import combinations
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_INDEX = ROOT / '.cache' / 'similarity' / 'index.npz'
+
+_MERSENNE = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64(0xFFFFFFFF)
+_CHUNK = 4096
+EXTRACTED_SUFFIX = '_extracted'  # extract_pdf_text writes <stem>_extracted.txt
+
+
+def shingle_hashes(text: str, k: int = 5) -> np.ndarray:
+    """Distinct CRC32 hashes of the word k-shingles of `text` (lower-cased)."""
+    tokens = re.findall(r'\w+', text.lower())
+    if not tokens:
+        return np.empty(0, dtype=np.uint64)
+    shingles = {' '.join(tokens[i:i + k]) for i in range(max(len(tokens) - k + 1, 1))}
+    return np.fromiter((zlib.crc32(s.encode('utf-8')) for s in shingles), dtype=np.uint64, count=len(shingles))
+
+
+def submission_id(cohort: str, path) -> str:
+    """Index id '<cohort>/<stem>' of a submission, given the original file or its extracted .txt."""
+    stem = Path(path).stem
+    if stem.endswith(EXTRACTED_SUFFIX):
+        stem = stem[:-len(EXTRACTED_SUFFIX)]
+    return f'{cohort}/{stem}'
+
+
+class MinHashIndex:
+    def __init__(self, num_perm: int = 128, bands: int = 32, shingle: int = 5, seed: int = 1):
+        """`bands` x (num_perm / bands) rows; pairs with Jaccard above about
+        (1 / bands) ** (bands / num_perm) are likely to become candidates."""
+        if num_perm % bands:
+            raise ValueError('num_perm must be a multiple of bands')
+        self.num_perm, self.bands, self.shingle, self.seed = num_perm, bands, shingle, seed
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, int(_MERSENNE), num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, int(_MERSENNE), num_perm, dtype=np.uint64)
+        self.ids: List[str] = []
+        self.cohorts: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self._sig_buf = np.empty((64, num_perm), dtype=np.uint32)
+        self._buckets: List[Dict[bytes, List[int]]] = [defaultdict(list) for _ in range(bands)]
+
+    @property
+    def _sigs(self) -> np.ndarray:
+        return self._sig_buf[:len(self.ids)]
+
+    def signature(self, text: str) -> np.ndarray:
+        hashes = shingle_hashes(text, self.shingle)
+        sig = np.full(self.num_perm, _MAX_HASH, dtype=np.uint64)
+        # Universal hashing (a*x + b) mod p, chunked so memory stays bounded on huge texts;
+        # uint64 wrap-around in a*x is intended, as in the usual MinHash implementations
+        for start in range(0, hashes.size, _CHUNK):
+            hv = hashes[start:start + _CHUNK, None]
+            permuted = ((hv * self._a + self._b) % _MERSENNE) & _MAX_HASH
+            np.minimum(sig, permuted.min(axis=0), out=sig)
+        return sig.astype(np.uint32)
+
+    def _band_keys(self, sig: np.ndarray) -> Iterable[Tuple[int, bytes]]:
+        rows = self.num_perm // self.bands
+        for band in range(self.bands):
+            yield band, sig[band * rows:(band + 1) * rows].tobytes()
+
+    def _is_empty(self, sig: np.ndarray) -> bool:
+        # Texts without a single word would all share every bucket
+        return bool((sig == np.uint32(_MAX_HASH)).all())
+
+    def add(self, doc_id: str, text: str, cohort: str = '') -> np.ndarray:
+        """Index `text` under `doc_id`; re-adding an id replaces its old signature."""
+        return self.add_signature(doc_id, self.signature(text), cohort)
+
+    def add_signature(self, doc_id: str, sig: np.ndarray, cohort: str = '') -> np.ndarray:
+        row = self._rows.get(doc_id)
+        if row is not None:
+            for band, key in self._band_keys(self._sigs[row]):
+                members = self._buckets[band].get(key)
+                if members and row in members:
+                    members.remove(row)
+            self.cohorts[row] = cohort
+        else:
+            row = self._rows[doc_id] = len(self.ids)
+            if row == len(self._sig_buf):  # grow by doubling: amortised O(1) appends
+                self._sig_buf = np.concatenate([self._sig_buf, np.empty_like(self._sig_buf)])
+            self.ids.append(doc_id)
+            self.cohorts.append(cohort)
+        self._sig_buf[row] = sig
+        if not self._is_empty(sig):
+            for band, key in self._band_keys(sig):
+                self._buckets[band][key].append(row)
+        return sig
+
+    def similarity(self, a: str, b: str) -> float:
+        """Estimated Jaccard similarity of two indexed documents."""
+        return float(np.mean(self._sigs[self._rows[a]] == self._sigs[self._rows[b]]))
+
+    def query(self, sig: np.ndarray, threshold: float = 0.5, exclude: Optional[str] = None) -> List[Tuple[str, float]]:
+        """Indexed documents whose estimated similarity to `sig` is at least `threshold`, best first."""
+        if self._is_empty(sig):
+            return []
+        rows: Set[int] = set()
+        for band, key in self._band_keys(sig):
+            rows.update(self._buckets[band].get(key, ()))
+        if exclude is not None and exclude in self._rows:
+            rows.discard(self._rows[exclude])
+        if not rows:
+            return []
+        cand = np.fromiter(rows, dtype=np.int64)
+        sims = (self._sigs[cand] == sig).mean(axis=1)
+        keep = sims >= threshold
+        order = np.argsort(-sims[keep], kind='stable')
+        return [(self.ids[r], float(s)) for r, s in zip(cand[keep][order], sims[keep][order])]
+
+    def pairs(self, threshold: float = 0.5, cohort: Optional[str] = None) -> List[Tuple[str, str, float]]:
+        """Near-duplicate pairs (id_a, id_b, similarity), most similar first.
+
+        With `cohort`, only pairs involving at least one document of that
+        cohort are returned (new work against itself and all earlier years).
+        """
+        seen: Set[Tuple[int, int]] = set()
+        for buckets in self._buckets:
+            for members in buckets.values():
+                if len(members) < 2:
+                    continue
+                for a, b in combinations(sorted(members), 2):
+                    if cohort is None or cohort in (self.cohorts[a], self.cohorts[b]):
+                        seen.add((a, b))
+        if not seen:
+            return []
+        pa, pb = np.array(sorted(seen)).T
+        sims = (self._sigs[pa] == self._sigs[pb]).mean(axis=1)
+        out = [(self.ids[a], self.ids[b], float(s)) for a, b, s in zip(pa, pb, sims) if s >= threshold]
+        return sorted(out, key=lambda t: -t[2])
+
+    def save(self, path: Path = DEFAULT_INDEX) -> Path:
+        """Write signatures and parameters atomically (no document text is stored)."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + '.tmp')
+        with open(tmp, 'wb') as f:
+            np.savez_compressed(
+                f, signatures=self._sigs, ids=np.array(self.ids, dtype=str), cohorts=np.array(self.cohorts, dtype=str),
+                params=np.array([self.num_perm, self.bands, self.shingle, self.seed], dtype=np.int64),
+            )
+        os.replace(tmp, path)
+        return path
+
+    @classmethod
+    def load(cls, path: Path = DEFAULT_INDEX) -> 'MinHashIndex':
+        with np.load(Path(path), allow_pickle=False) as data:
+            num_perm, bands, shingle, seed = (int(v) for v in data['params'])
+            index = cls(num_perm, bands, shingle, seed)
+            for doc_id, cohort, sig in zip(data['ids'].tolist(), data['cohorts'].tolist(), data['signatures']):
+                index.add_signature(doc_id, sig, cohort)
+        return index
+
+    @classmethod
+    def open(cls, path: Path = DEFAULT_INDEX, **params) -> 'MinHashIndex':
+        """Load the index at `path` if it exists, otherwise start an empty one."""
+        return cls.load(path) if Path(path).exists() else cls(**params)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Add extracted texts to the similarity index and list near-duplicates')
+    parser.add_argument('text_dir', type=Path, help='directory of extracted .txt files')
+    parser.add_argument('--cohort', required=True, help='label for these submissions, e.g. 2025')
+    parser.add_argument('--index', type=Path, default=DEFAULT_INDEX)
+    parser.add_argument('--threshold', type=float, default=0.5)
+    args = parser.parse_args(argv)
+
+    index = MinHashIndex.open(args.index)
+    files = sorted(args.text_dir.glob('*.txt'))
+    for f in files:
+        index.add(submission_id(args.cohort, f), f.read_text(encoding='utf-8', errors='ignore'), args.cohort)
+    index.save(args.index)
+    pairs = index.pairs(args.threshold, cohort=args.cohort)
+    print(f'{len(files)} texts added; index holds {len(index.ids)} documents; {len(pairs)} pairs >= {args.threshold}')
+    for a, b, s in pairs:
+        print(f'  {s:.2f}  {a}  <->  {b}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,359 @@
+"""Mergeable, single-pass summary statistics for data that arrives in chunks.
+
+GroupedStats keeps per-group count/mean/M2 (Welford's moments), merging each
+chunk with Chan et al.'s parallel update, so grouped means, variances and
+normal-approximation CIs can be computed over iterators such as
+`pd.read_csv(path, chunksize=...)` without holding the data in memory.
+Quantiles (median, percentiles) come from a fixed-size uniform sample per
+group (bottom-k by random priority), which is itself mergeable.
+
+RollingStats is the per-sample counterpart for live feeds: rolling
+per-group means and variances over the last `window` samples, updated in
+constant time as each record arrives.
+"""
+from __future__ import annotations
+
+from collections import deque
+from typing import Deque, Dict, Hashable, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+
+def parse_quantile(agg: str) -> Optional[float]:
+    """'mean' -> None, 'median' -> 0.5, 'p90' -> 0.9; anything else is an error."""
+    if agg == "mean":
+        return None
+    if agg == "median":
+        return 0.5
+    if agg.startswith("p"):
+        try:
+            q = float(agg[1:]) / 100.0
+        except ValueError:
+            q = -1.0
+        if 0.0 <= q <= 1.0:
+            return q
+    raise ValueError(f"Unsupported agg {agg!r}; use 'mean', 'median' or a percentile like 'p90'")
+
+
+def iter_frames(data: Union[pd.DataFrame, Iterable[pd.DataFrame]]) -> Iterable[pd.DataFrame]:
+    if isinstance(data, pd.DataFrame):
+        yield data
+    else:
+        yield from data
+
+
+class GroupedStats:
+    def __init__(self, sample_size: int = 0, random_state: int = 0):
+        """`sample_size` > 0 also keeps that many values per group for quantiles."""
+        self.sample_size = sample_size
+        self._rng = np.random.default_rng(random_state)
+        self._ids: Dict[Hashable, int] = {}
+        self._keys: List[Hashable] = []
+        self._n = np.zeros(0)
+        self._mean = np.zeros(0)
+        self._m2 = np.zeros(0)
+        self._samples: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+
+    def _group_ids(self, uniques) -> np.ndarray:
+        gids = np.empty(len(uniques), dtype=np.int64)
+        for i, key in enumerate(uniques):
+            gid = self._ids.get(key)
+            if gid is None:
+                gid = self._ids[key] = len(self._keys)
+                self._keys.append(key)
+            gids[i] = gid
+        grow = len(self._keys) - len(self._n)
+        if grow > 0:
+            self._n = np.concatenate([self._n, np.zeros(grow)])
+            self._mean = np.concatenate([self._mean, np.zeros(grow)])
+            self._m2 = np.concatenate([self._m2, np.zeros(grow)])
+        return gids
+
+    def update(self, keys, values) -> "GroupedStats":
+        """Fold one chunk of (group key, value) pairs into the running statistics.
+
+        Rows with a missing key or value are skipped, as in DataFrame.groupby.
+        """
+        keys = pd.Series(keys).reset_index(drop=True)
+        values = pd.to_numeric(pd.Series(values).reset_index(drop=True), errors="coerce").to_numpy(dtype=float)
+        codes, uniques = pd.factorize(keys, use_na_sentinel=True)
+        # Register every key, so all-NaN groups still appear (as in groupby)
+        all_gids = self._group_ids(uniques)
+        ok = (codes >= 0) & ~np.isnan(values)
+        codes, values = codes[ok], values[ok]
+        if values.size == 0:
+            return self
+        k = len(uniques)
+        # Chunk moments: two vectorised passes over the chunk (stable within it)
+        n_b = np.bincount(codes, minlength=k).astype(float)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean_b = np.bincount(codes, weights=values, minlength=k) / n_b
+        m2_b = np.bincount(codes, weights=(values - mean_b[codes]) ** 2, minlength=k)
+        present = n_b > 0
+        gids = all_gids[present]
+        n_b, mean_b, m2_b = n_b[present], mean_b[present], m2_b[present]
+
+        # Chan et al. parallel merge with the running moments
+        n_a, mean_a, m2_a = self._n[gids], self._mean[gids], self._m2[gids]
+        n = n_a + n_b
+        delta = mean_b - mean_a
+        self._mean[gids] = mean_a + delta * n_b / n
+        self._m2[gids] = m2_a + m2_b + delta ** 2 * n_a * n_b / n
+        self._n[gids] = n
+
+        if self.sample_size:
+            self._update_samples(codes, values, all_gids)
+        return self
+
+    def _update_samples(self, codes: np.ndarray, values: np.ndarray, gids: np.ndarray) -> None:
+        # Bottom-k sampling: every value gets a uniform random priority and each
+        # group keeps the k smallest, i.e. a uniform sample without replacement.
+        priorities = self._rng.random(values.size)
+        order = np.argsort(codes, kind="stable")
+        bounds = np.flatnonzero(np.diff(codes[order])) + 1
+        for rows in np.split(order, bounds):
+            gid = int(gids[codes[rows[0]]])
+            vals, pri = values[rows], priorities[rows]
+            if gid in self._samples:
+                old_vals, old_pri = self._samples[gid]
+                vals, pri = np.concatenate([old_vals, vals]), np.concatenate([old_pri, pri])
+            if vals.size > self.sample_size:
+                keep = np.argpartition(pri, self.sample_size)[:self.sample_size]
+                vals, pri = vals[keep], pri[keep]
+            self._samples[gid] = (vals, pri)
+
+    def merge(self, other: "GroupedStats") -> "GroupedStats":
+        """Fold another GroupedStats (e.g. from a worker process) into this one."""
+        if not other._keys:
+            return self
+        gids = self._group_ids(other._keys)
+        n_a, mean_a, m2_a = self._n[gids], self._mean[gids], self._m2[gids]
+        n_b, mean_b, m2_b = other._n, other._mean, other._m2
+        n = n_a + n_b
+        delta = mean_b - mean_a
+        with np.errstate(invalid="ignore", divide="ignore"):
+            self._mean[gids] = np.where(n > 0, mean_a + delta * n_b / n, 0.0)
+            self._m2[gids] = np.where(n > 0, m2_a + m2_b + delta ** 2 * n_a * n_b / n, 0.0)
+        self._n[gids] = n
+        if self.sample_size:
+            for other_gid, (vals, pri) in other._samples.items():
+                gid = int(gids[other_gid])
+                if gid in self._samples:
+                    vals = np.concatenate([self._samples[gid][0], vals])
+                    pri = np.concatenate([self._samples[gid][1], pri])
+                if vals.size > self.sample_size:
+                    keep = np.argpartition(pri, self.sample_size)[:self.sample_size]
+                    vals, pri = vals[keep], pri[keep]
+                self._samples[gid] = (vals, pri)
+        return self
+
+    def _ordered(self, values) -> pd.Series:
+        s = pd.Series(values, index=pd.Index(self._keys))
+        try:
+            return s.sort_index()
+        except TypeError:  # unorderable mixed keys: keep first-seen order
+            return s
+
+    def summary(self) -> pd.DataFrame:
+        """count, mean, var and std (ddof=1) per group, sorted by group key."""
+        with np.errstate(invalid="ignore", divide="ignore"):
+            var = np.where(self._n > 1, self._m2 / (self._n - 1), np.nan)
+        out = pd.DataFrame({
+            "count": self._ordered(self._n.astype(np.int64)),
+            "mean": self._ordered(np.where(self._n > 0, self._mean, np.nan)),
+            "var": self._ordered(var),
+        })
+        out["std"] = np.sqrt(out["var"])
+        return out
+
+    def quantile_interval(self, q: float, z: float) -> pd.DataFrame:
+        """Sample quantile per group with a distribution-free CI.
+
+        The interval uses order statistics at ranks m*q +/- z*sqrt(m*q*(1-q))
+        of the m sampled values. It is exact when a group has at most
+        `sample_size` values and conservative (wider) otherwise.
+        """
+        if not self.sample_size:
+            raise ValueError("quantiles need GroupedStats(sample_size > 0)")
+        est, lo, hi = [], [], []
+        for gid in range(len(self._keys)):
+            vals = np.sort(self._samples.get(gid, (np.empty(0), None))[0])
+            m = vals.size
+            if m == 0:
+                est.append(np.nan)
+                lo.append(np.nan)
+                hi.append(np.nan)
+                continue
+            half = z * np.sqrt(m * q * (1 - q))
+            est.append(float(np.quantile(vals, q)))
+            lo.append(float(vals[int(np.clip(np.floor(m * q - half), 0, m - 1))]))
+            hi.append(float(vals[int(np.clip(np.ceil(m * q + half), 0, m - 1))]))
+        return pd.DataFrame({"value": self._ordered(est), "lower": self._ordered(lo), "upper": self._ordered(hi)})
+
+
+class BinnedStats2D:
+    """Counts (and sums of an optional third variable) on a fixed 2-D grid,
+    accumulated chunk by chunk and optionally split by facet.
+
+    All points of a chunk -- across every facet -- are binned with a single
+    np.bincount over a flattened (facet, x-bin, y-bin) index, so cost is
+    linear in rows and the result size depends only on the grid.
+    """
+
+    def __init__(self, x_range: Tuple[float, float], y_range: Tuple[float, float], bins: Union[int, Tuple[int, int]] = 100):
+        self.bins = (bins, bins) if isinstance(bins, int) else tuple(bins)
+        self.x_edges = np.linspace(x_range[0], x_range[1], self.bins[0] + 1)
+        self.y_edges = np.linspace(y_range[0], y_range[1], self.bins[1] + 1)
+        self._ids: Dict[Hashable, int] = {}
+        self._keys: List[Hashable] = []
+        self._counts: List[np.ndarray] = []
+        self._sums: List[np.ndarray] = []
+
+    def _bin(self, values: np.ndarray, edges: np.ndarray) -> np.ndarray:
+        lo, hi, nb = edges[0], edges[-1], len(edges) - 1
+        idx = np.floor((values - lo) / (hi - lo) * nb).astype(np.int64)
+        idx[values == hi] = nb - 1  # right edge is inclusive, as in histogram2d
+        idx[(values < lo) | (values > hi) | np.isnan(values)] = -1
+        return idx
+
+    def update(self, x, y, z=None, facet=None) -> "BinnedStats2D":
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        ix, iy = self._bin(x, self.x_edges), self._bin(y, self.y_edges)
+        ok = (ix >= 0) & (iy >= 0)
+        if z is not None:
+            z = np.asarray(z, dtype=float)
+            ok &= ~np.isnan(z)
+        if facet is None:
+            codes, uniques = np.zeros(len(x), dtype=np.int64), [None]
+        elif isinstance(facet, pd.DataFrame):
+            codes, uniques = pd.MultiIndex.from_frame(facet).factorize()
+        else:
+            codes, uniques = pd.factorize(pd.Series(facet).reset_index(drop=True))
+        ok &= codes >= 0
+        bx, by = self.bins
+        cells = bx * by
+        gids = []
+        for key in uniques:
+            if key not in self._ids:
+                self._ids[key] = len(self._keys)
+                self._keys.append(key)
+                self._counts.append(np.zeros((bx, by)))
+                self._sums.append(np.zeros((bx, by)))
+            gids.append(self._ids[key])
+        flat = (codes[ok] * cells + ix[ok] * by + iy[ok])
+        size = len(uniques) * cells
+        counts = np.bincount(flat, minlength=size).reshape(len(uniques), bx, by)
+        sums = None
+        if z is not None:
+            sums = np.bincount(flat, weights=z[ok], minlength=size).reshape(len(uniques), bx, by)
+        for i, gid in enumerate(gids):
+            self._counts[gid] += counts[i]
+            if sums is not None:
+                self._sums[gid] += sums[i]
+        return self
+
+    def facets(self) -> List[Hashable]:
+        try:
+            return sorted(self._keys)
+        except TypeError:
+            return list(self._keys)
+
+    def counts(self, facet=None) -> np.ndarray:
+        return self._counts[self._ids[facet]]
+
+    def means(self, facet=None, min_count: int = 1) -> np.ndarray:
+        counts = self.counts(facet)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(counts >= min_count, self._sums[self._ids[facet]] / counts, np.nan)
+
+
+class _Window:
+    __slots__ = ("n", "mean", "m2", "values", "since_rebase")
+
+    def __init__(self, n_fields: int, window: Optional[int]):
+        self.n = 0
+        self.since_rebase = 0
+        self.mean = [0.0] * n_fields
+        self.m2 = [0.0] * n_fields
+        self.values: Optional[Deque[Tuple[float, ...]]] = deque() if window else None
+
+    def rebase(self) -> None:
+        """Recompute mean and M2 exactly from the stored window (two-pass)."""
+        self.since_rebase = 0
+        for j, col in enumerate(zip(*self.values)):
+            mean = sum(col) / self.n
+            self.mean[j] = mean
+            self.m2[j] = sum((x - mean) ** 2 for x in col)
+
+
+class RollingStats:
+    """Rolling per-group mean and variance of several fields, O(1) per sample.
+
+    Each group keeps the last `window` samples (all samples if window is
+    None). Adding a sample is a Welford update and evicting the oldest one is
+    the matching downdate, so the cost per update does not depend on the
+    window length or on how many samples have been seen. Add/evict rounding
+    errors would otherwise accumulate over an endless stream, so each group
+    is recomputed from its window every `window` updates (amortised O(1)).
+    """
+
+    def __init__(self, fields: Sequence[str], window: Optional[int] = 1000):
+        if window is not None and window < 2:
+            raise ValueError("window must be at least 2 (or None for all samples)")
+        self.fields = tuple(fields)
+        self.window = window
+        self._groups: Dict[Hashable, _Window] = {}
+
+    def update(self, key: Hashable, record: Union[Mapping, Sequence[float]]) -> "RollingStats":
+        """Add one sample for group `key`; `record` is a mapping with every field, or the values in field order."""
+        if isinstance(record, Mapping):
+            values = tuple(float(record[f]) for f in self.fields)
+        else:
+            values = tuple(float(v) for v in record)
+        g = self._groups.get(key)
+        if g is None:
+            g = self._groups[key] = _Window(len(self.fields), self.window)
+        mean, m2 = g.mean, g.m2
+        if g.values is not None and g.n == self.window:
+            old = g.values.popleft()
+            n = g.n - 1
+            for j, x in enumerate(old):
+                d = x - mean[j]
+                mean[j] -= d / n
+                m2[j] = max(m2[j] - d * (x - mean[j]), 0.0)
+            g.n = n
+        g.n += 1
+        for j, x in enumerate(values):
+            d = x - mean[j]
+            mean[j] += d / g.n
+            m2[j] += d * (x - mean[j])
+        if g.values is not None:
+            g.values.append(values)
+            g.since_rebase += 1
+            if g.since_rebase >= self.window:
+                g.rebase()
+        return self
+
+    def update_frame(self, df: pd.DataFrame, key_col: str) -> "RollingStats":
+        """Feed the rows of a DataFrame in order."""
+        cols = [df[key_col].to_numpy()] + [df[f].to_numpy(dtype=float) for f in self.fields]
+        for key, *values in zip(*cols):
+            self.update(key, values)
+        return self
+
+    def summary(self) -> pd.DataFrame:
+        """One row per group: count plus <field>_mean and <field>_var (ddof=1)."""
+        rows = {}
+        for key, g in self._groups.items():
+            row = {"count": g.n}
+            for j, f in enumerate(self.fields):
+                row[f"{f}_mean"] = g.mean[j]
+                row[f"{f}_var"] = max(g.m2[j], 0.0) / (g.n - 1) if g.n > 1 else np.nan
+            rows[key] = row
+        out = pd.DataFrame.from_dict(rows, orient="index")
+        try:
+            return out.sort_index()
+        except TypeError:
+            return out
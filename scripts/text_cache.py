@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""On-disk, content-addressed cache for extracted document text.
+
+Entries are keyed by the SHA-256 of the source file's bytes plus the
+extractor name and version, so renaming or touching a file is a hit while
+editing it (or upgrading the extractor) is a miss. The cache is bounded in
+total size and evicts least-recently-used entries first.
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import subprocess
+import tempfile
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_CACHE_DIR = Path(os.environ.get('ARCH7476_TEXT_CACHE', ROOT / '.cache' / 'text'))
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+# Eviction frees down to this fraction of max_bytes, so the puts that follow
+# a full cache do not each trigger another directory scan
+LOW_WATER = 0.9
+_CHUNK = 1 << 20
+
+
+def file_digest(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(_CHUNK), b''):
+            h.update(block)
+    return h.hexdigest()
+
+
+@lru_cache(maxsize=None)
+def tool_version(*cmd: str) -> str:
+    """First line of a command-line tool's version banner (or 'unknown')."""
+    try:
+        res = subprocess.run(list(cmd), capture_output=True, timeout=10)
+    except Exception:
+        return 'unknown'
+    banner = (res.stdout or res.stderr).decode('utf-8', errors='ignore').strip()
+    return banner.splitlines()[0] if banner else 'unknown'
+
+
+class TextCache:
+    def __init__(self, cache_dir: Optional[Path] = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else DEFAULT_CACHE_DIR
+        self.max_bytes = max_bytes
+        # Running total of entry sizes; filled by the first scan, then kept up
+        # to date by put() so eviction only rescans when the limit is passed.
+        self._size: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def key(self, path: Path, extractor: str, version: str) -> str:
+        h = hashlib.sha256(f'{extractor}\0{version}\0'.encode('utf-8'))
+        h.update(file_digest(path).encode('ascii'))
+        return h.hexdigest()
+
+    def _entry(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f'{key}.txt'
+
+    def get(self, key: str) -> Optional[str]:
+        entry = self._entry(key)
+        try:
+            text = entry.read_text(encoding='utf-8')
+        except OSError:
+            return None
+        # mtime doubles as the LRU clock
+        try:
+            os.utime(entry)
+        except OSError:
+            pass
+        return text
+
+    def put(self, key: str, text: str) -> None:
+        entry = self._entry(key)
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        data = text.encode('utf-8')
+        # A unique temp file per call: threads and processes may store the same key at once
+        with tempfile.NamedTemporaryFile(dir=entry.parent, prefix=entry.name + '.', suffix='.tmp',
+                                         delete=False) as f:
+            try:
+                f.write(data)
+            except BaseException:
+                f.close()
+                os.unlink(f.name)
+                raise
+        try:
+            old_size = entry.stat().st_size
+        except OSError:
+            old_size = 0
+        os.replace(f.name, entry)
+        with self._lock:
+            if self._size is None:
+                self._size = self._scan()[1]
+            else:
+                self._size += len(data) - old_size
+            over = self._size > self.max_bytes
+        if over:
+            self.evict()
+
+    def _scan(self) -> Tuple[List[Tuple[int, int, Path]], int]:
+        entries = []
+        total = 0
+        for p in self.cache_dir.glob('*/*.txt'):
+            try:
+                st = p.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime_ns, st.st_size, p))
+            total += st.st_size
+        return entries, total
+
+    def evict(self) -> None:
+        """Once over max_bytes, drop least-recently-used entries down to LOW_WATER of it."""
+        with self._lock:
+            entries, total = self._scan()
+            if total > self.max_bytes:
+                target = int(self.max_bytes * LOW_WATER)
+                entries.sort()
+                for _, size, p in entries:
+                    if total <= target:
+                        break
+                    try:
+                        p.unlink()
+                        total -= size
+                    except OSError:
+                        pass
+            self._size = total
+
+    def fetch(self, path: Path, extractor: str, version: str, extract: Callable[[Path], str]) -> str:
+        """Return cached text for `path`, calling `extract(path)` on a miss.
+
+        Exceptions from `extract` propagate and nothing is stored, so failed
+        extractions are retried on the next run.
+        """
+        key = self.key(path, extractor, version)
+        text = self.get(key)
+        if text is None:
+            text = extract(path)
+            self.put(key, text)
+        return text
+
+    def clear(self) -> None:
+        for p in self.cache_dir.glob('*/*.txt'):
+            try:
+                p.unlink()
+            except OSError:
+                pass
+        with self._lock:
+            self._size = 0
+
+
+DEFAULT_CACHE = TextCache()